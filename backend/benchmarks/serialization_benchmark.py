@@ -0,0 +1,183 @@
+"""Requests/sec on hot routes with and without FAST_SERIALIZATION.
+
+The app is driven in-process through its ASGI interface with canned TMDB
+and database responses, so the numbers reflect routing, validation and
+serialization cost rather than network or MongoDB latency.
+
+Most of the /api/movies/trending gain comes from the pre-serialized
+category payload cache (row_payloads), which in fast mode answers repeat
+requests without calling get_category at all. /api/search has no payload
+cache and runs its full pipeline on every request, so its figure is the
+closer measure of orjson rendering and skipped re-validation alone.
+
+Usage (from backend/):
+    python benchmarks/serialization_benchmark.py [--requests 2000] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = [
+    ("/api/movies/trending", b""),
+    ("/api/search", b"q=night"),
+]
+
+
+def _tmdb_movie(i: int) -> dict:
+    return {
+        "id": 1000 + i,
+        "title": f"Benchmark Movie {i}",
+        "overview": "A synthetic title used to measure serialization throughput. " * 3,
+        "genre_ids": [28, 12, 878],
+        "vote_average": 7.5,
+        "release_date": "2021-06-01",
+        "poster_path": f"/poster{i}.jpg",
+        "backdrop_path": f"/backdrop{i}.jpg",
+        "popularity": 100.0 - i,
+    }
+
+
+def _tmdb_series(i: int) -> dict:
+    return {
+        "id": 5000 + i,
+        "name": f"Benchmark Night Series {i}",
+        "overview": "A synthetic series used to measure serialization throughput. " * 3,
+        "genre_ids": [18, 9648],
+        "vote_average": 8.1,
+        "first_air_date": "2019-09-01",
+        "poster_path": f"/series{i}.jpg",
+        "backdrop_path": f"/series_backdrop{i}.jpg",
+    }
+
+
+def _stored_doc(i: int) -> dict:
+    return {
+        "id": f"stored-{i}",
+        "tmdb_id": 9000 + i,
+        "title": f"Stored Night Title {i}",
+        "description": "Catalog copy read back from MongoDB.",
+        "genre": ["Drama"],
+        "rating": 6.9,
+        "year": 2015,
+        "thumbnail": f"https://image.tmdb.org/t/p/w500/stored{i}.jpg",
+        "backdrop_image": f"https://image.tmdb.org/t/p/w1280/stored{i}.jpg",
+        "categories": ["popular"],
+        "duration": "110 min",
+        "popularity": 12.5,
+    }
+
+
+def _install_fixtures(server):
+    """Replace upstream calls with canned responses"""
+    movies = {"results": [_tmdb_movie(i) for i in range(20)]}
+    series = {"results": [_tmdb_series(i) for i in range(20)]}
+
+    async def fetch(endpoint, params=None):
+        return series if endpoint.startswith("search/tv") else movies
+
+    async def search_catalog(collection, query, limit, prefix):
+        return [_stored_doc(i) for i in range(limit)]
+
+    server.tmdb_service._fetch = fetch
+    server.database.movies = server.database.series = None
+    server.database._search_catalog = search_catalog
+    server.write_behind.enqueue_movies = lambda items: len(items)
+    server.write_behind.enqueue_series = lambda items: len(items)
+
+
+async def _request(app, path: str, query: bytes) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": query, "root_path": "", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+    status = 0
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _measure(app, path: str, query: bytes, requests: int, concurrency: int) -> float:
+    # Warm caches and lazy initialization before timing
+    for _ in range(5):
+        assert await _request(app, path, query) == 200
+
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await _request(app, path, query)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+def run_mode(requests: int, concurrency: int):
+    """Benchmark the current process's FAST_SERIALIZATION setting, printing JSON"""
+    sys.path.insert(0, BACKEND_DIR)
+    import server
+    logging.getLogger().setLevel(logging.WARNING)
+    _install_fixtures(server)
+
+    async def main():
+        return {
+            path: round(await _measure(server.app, path, query, requests, concurrency), 1)
+            for path, query in ROUTES
+        }
+
+    print(json.dumps(asyncio.run(main())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mode", choices=["true", "false"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.requests, args.concurrency)
+        return
+
+    results = {}
+    for mode in ("false", "true"):
+        # The response cache would answer repeat requests from stored bytes in both modes
+        env = dict(os.environ, FAST_SERIALIZATION=mode, RESPONSE_CACHE_ENABLED="false")
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode,
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'route':<28}{'before req/s':>14}{'after req/s':>14}{'speedup':>10}")
+    for path, _ in ROUTES:
+        before, after = results["false"][path], results["true"][path]
+        print(f"{path:<28}{before:>14.1f}{after:>14.1f}{after / before:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
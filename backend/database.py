@@ -1,11 +1,107 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from typing import Optional, List, Dict, Any
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, FrozenSet, Iterable, Tuple
+from datetime import datetime
+import hashlib
+import json
 import os
+import re
 import logging
-from models import User, Movie, Series, Sports, WatchlistItem
+from models import User, Movie, Series, Sports, WatchlistItem, ContentCard
+from services.cache import TTLCache
+from services.text_normalizer import tokenize
 
 logger = logging.getLogger(__name__)
 
+# Maximum operations sent in a single bulk_write call
+BULK_WRITE_BATCH_SIZE = int(os.environ.get('MONGO_BULK_BATCH_SIZE', 500))
+
+# Fail startup when a known query path is answered by a collection scan
+REQUIRE_INDEXED_QUERIES = os.environ.get('MONGO_REQUIRE_INDEXED_QUERIES', 'false').lower() in ('1', 'true', 'yes')
+
+# Only documents with a real TMDB id take part in the tmdb_id uniqueness constraint
+_HAS_TMDB_ID = {"tmdb_id": {"$gt": 0}}
+
+# Internal bookkeeping fields that never leave the database
+_CATALOG_PROJECTION = {"_id": 0, "content_hash": 0, "search_tokens": 0}
+
+# Only the fields a ContentCard needs
+_CARD_PROJECTION = {"_id": 0, **{field: 1 for field in ContentCard.model_fields}}
+
+def _from_doc(model, doc: Dict[str, Any]):
+    """Build a model from one of our own (already validated) catalog documents without re-validating it"""
+    return model.model_construct(**doc)
+
+# Indexes for every query path, created idempotently at startup
+INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True)
+    ],
+    "movies": [
+        IndexModel([("tmdb_id", ASCENDING)], name="tmdb_id_unique", unique=True,
+                   partialFilterExpression=_HAS_TMDB_ID),
+        IndexModel([("categories", ASCENDING)], name="categories"),
+        IndexModel([("search_tokens", ASCENDING)], name="search_tokens"),
+        IndexModel([("title", TEXT), ("description", TEXT)], name="title_description_text",
+                   weights={"title": 10, "description": 1}, default_language="none")
+    ],
+    "series": [
+        IndexModel([("tmdb_id", ASCENDING)], name="tmdb_id_unique", unique=True,
+                   partialFilterExpression=_HAS_TMDB_ID),
+        IndexModel([("categories", ASCENDING)], name="categories"),
+        IndexModel([("search_tokens", ASCENDING)], name="search_tokens"),
+        IndexModel([("title", TEXT), ("description", TEXT)], name="title_description_text",
+                   weights={"title": 10, "description": 1}, default_language="none")
+    ],
+    "sports": [
+        IndexModel([("title", ASCENDING), ("start_time", ASCENDING)], name="title_start_time"),
+        IndexModel([("status", ASCENDING)], name="status")
+    ],
+    "watchlist": [
+        IndexModel([("user_id", ASCENDING), ("content_id", ASCENDING)], name="user_content_unique", unique=True),
+        IndexModel([("user_id", ASCENDING), ("added_at", DESCENDING), ("content_id", DESCENDING)], name="user_added_at")
+    ]
+}
+
+# Representative filters for each query path, checked with explain()
+INDEXED_QUERIES: List[tuple] = [
+    ("users", {"email": "user@example.com"}),
+    ("users", {"id": "user-id"}),
+    ("movies", {"tmdb_id": 1}),
+    ("movies", {"categories": "trending"}),
+    ("series", {"tmdb_id": 1}),
+    ("series", {"categories": "series"}),
+    ("movies", {"search_tokens": {"$regex": "^sho"}}),
+    ("series", {"search_tokens": {"$regex": "^sho"}}),
+    ("sports", {"title": "title", "start_time": None}),
+    ("sports", {"status": "Live"}),
+    ("watchlist", {"user_id": "user-id"}),
+    ("watchlist", {"user_id": "user-id", "content_id": "content-id"}),
+    ("movies", {"tmdb_id": {"$in": [1, 2]}})
+]
+
+# Users looked up by id are cached briefly; writes invalidate the entry
+USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 30))
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 10000))
+
+# Catalog content fingerprints kept in memory per collection
+FINGERPRINT_CACHE_SIZE = int(os.environ.get('FINGERPRINT_CACHE_SIZE', 100000))
+# Bump when the stored document shape changes so existing documents get rewritten
+FINGERPRINT_VERSION = 3
+# Fields that change on every transform, or (categories) depend on which row
+# fetched the title, and must not affect the fingerprint
+FINGERPRINT_EXCLUDED_FIELDS = {"id", "content_hash", "categories"}
+
+def content_fingerprint(doc: Dict[str, Any]) -> str:
+    """Stable hash of a catalog document's content"""
+    payload = {k: v for k, v in doc.items() if k not in FINGERPRINT_EXCLUDED_FIELDS}
+    payload["_v"] = FINGERPRINT_VERSION
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
 class Database:
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None
@@ -15,6 +111,19 @@ class Database:
         self.series: Optional[AsyncIOMotorCollection] = None
         self.sports: Optional[AsyncIOMotorCollection] = None
         self.watchlist: Optional[AsyncIOMotorCollection] = None
+        
+        # tmdb_id -> (content hash, categories) of the last persisted version, per collection
+        self._fingerprints: Dict[str, "OrderedDict[int, Tuple[str, FrozenSet[str]]]"] = {
+            "movies": OrderedDict(), "series": OrderedDict()
+        }
+        self.index_report: Dict[str, Any] = {}
+        self._user_cache = TTLCache(maxsize=USER_CACHE_SIZE, default_ttl=USER_CACHE_TTL)
+        # Callbacks notified with (collection name, items) after catalog writes
+        self._save_listeners: List[Callable[[str, List[Any]], None]] = []
+        self.write_stats: Dict[str, Dict[str, int]] = {
+            "movies": {"written": 0, "skipped": 0},
+            "series": {"written": 0, "skipped": 0}
+        }
     
     async def connect(self):
         """Connect to MongoDB"""
@@ -32,6 +141,10 @@ class Database:
         self.watchlist = self.db.watchlist
         
         logger.info("Connected to MongoDB")
+        
+        await self.ensure_indexes()
+        if REQUIRE_INDEXED_QUERIES:
+            await self.verify_indexed_queries()
     
     async def disconnect(self):
         """Disconnect from MongoDB"""
@@ -39,6 +152,61 @@ class Database:
             self.client.close()
             logger.info("Disconnected from MongoDB")
     
+    # Index management
+    async def ensure_indexes(self) -> Dict[str, Any]:
+        """Create the indexes in INDEX_SPECS and report missing or unused ones"""
+        report: Dict[str, Any] = {}
+        
+        for name, indexes in INDEX_SPECS.items():
+            collection = self.db[name]
+            failed = []
+            for index in indexes:
+                try:
+                    await collection.create_indexes([index])
+                except OperationFailure as e:
+                    # e.g. existing duplicates violate a unique constraint
+                    failed.append(index.document["name"])
+                    logger.error(f"Could not create index {name}.{index.document['name']}: {str(e)}")
+            
+            existing = await collection.index_information()
+            expected = {index.document["name"] for index in indexes}
+            
+            unused = []
+            try:
+                async for stats in collection.aggregate([{"$indexStats": {}}]):
+                    if stats["name"] != "_id_" and stats["accesses"]["ops"] == 0:
+                        unused.append(stats["name"])
+            except OperationFailure as e:
+                logger.debug(f"$indexStats unavailable for {name}: {str(e)}")
+            
+            report[name] = {
+                "missing": sorted(expected - set(existing)),
+                "unmanaged": sorted(set(existing) - expected - {"_id_"}),
+                "unused_since_restart": sorted(unused),
+                "failed": failed
+            }
+            if report[name]["missing"]:
+                logger.warning(f"Missing indexes on {name}: {report[name]['missing']}")
+            if report[name]["unmanaged"]:
+                logger.info(f"Indexes on {name} not in INDEX_SPECS: {report[name]['unmanaged']}")
+        
+        self.index_report = report
+        logger.info("MongoDB indexes verified")
+        return report
+    
+    async def verify_indexed_queries(self):
+        """Raise if any known query path resolves to a collection scan"""
+        offenders = []
+        for name, query in INDEXED_QUERIES:
+            plan = await self.db[name].find(query).explain()
+            winning_plan = plan.get("queryPlanner", {}).get("winningPlan", {})
+            if "COLLSCAN" in json.dumps(winning_plan, default=str):
+                offenders.append(f"{name} {query}")
+        
+        if offenders:
+            raise RuntimeError(f"Queries without index support: {'; '.join(offenders)}")
+        logger.info("All known query paths use an index")
+    
     # User operations
     async def create_user(self, user: User) -> User:
         """Create a new user"""
@@ -54,81 +222,193 @@ class Database:
         return None
     
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
-        """Get user by ID"""
+        """Get user by ID (served from a short-lived cache)"""
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+        
         user_doc = await self.users.find_one({"id": user_id})
         if user_doc:
-            return User(**user_doc)
+            user = User(**user_doc)
+            self._user_cache.set(user_id, user)
+            return user
         return None
     
-    # Movies operations
-    async def save_movies(self, movies: List[Movie]) -> List[Movie]:
-        """Save movies to database (upsert based on tmdb_id)"""
-        for movie in movies:
-            movie_dict = movie.dict()
-            if movie.tmdb_id:
-                # Update existing or insert new
-                await self.movies.update_one(
-                    {"tmdb_id": movie.tmdb_id},
-                    {"$set": movie_dict},
-                    upsert=True
-                )
+    async def update_user_password_hash(self, user_id: str, password_hash: str):
+        """Replace a user's stored password hash"""
+        await self.users.update_one({"id": user_id}, {"$set": {"password_hash": password_hash}})
+        self.invalidate_user(user_id)
+    
+    def invalidate_user(self, user_id: str):
+        """Drop a cached user after their profile or watchlist changes"""
+        self._user_cache.delete(user_id)
+    
+    # Bulk write helper
+    async def _bulk_write(self, collection: AsyncIOMotorCollection, operations: List[Any]) -> Dict[str, int]:
+        """Run operations as unordered bulk writes in batches and sum the results"""
+        counts = {"matched": 0, "modified": 0, "upserted": 0, "inserted": 0}
+        
+        for start in range(0, len(operations), BULK_WRITE_BATCH_SIZE):
+            batch = operations[start:start + BULK_WRITE_BATCH_SIZE]
+            result = await collection.bulk_write(batch, ordered=False)
+            counts["matched"] += result.matched_count
+            counts["modified"] += result.modified_count
+            counts["upserted"] += result.upserted_count
+            counts["inserted"] += result.inserted_count
+        
+        return counts
+    
+    # Catalog upserts with change detection
+    def add_save_listener(self, listener: Callable[[str, List[Any]], None]):
+        """Register a callback invoked with (collection name, items) after movies/series are persisted"""
+        self._save_listeners.append(listener)
+    
+
+    def _remember_fingerprint(self, name: str, tmdb_id: int, fingerprint: str, categories: Iterable[str]):
+        fingerprints = self._fingerprints[name]
+        known = fingerprints.get(tmdb_id)
+        # Stored categories only ever grow ($addToSet), whatever the content
+        fingerprints[tmdb_id] = (fingerprint, known[1].union(categories) if known else frozenset(categories))
+        fingerprints.move_to_end(tmdb_id)
+        while len(fingerprints) > FINGERPRINT_CACHE_SIZE:
+            fingerprints.popitem(last=False)
+    
+    async def _upsert_catalog(self, name: str, items: List[Any]) -> Dict[str, int]:
+        """Upsert movies or series by tmdb_id, skipping items whose content is unchanged.
+        
+        Categories are merged into the stored document rather than replaced,
+        since the same title is fetched by several rows.
+        """
+        collection = getattr(self, name)
+        fingerprints = self._fingerprints[name]
+        
+        # Latest version of each tmdb_id in this batch, with its fingerprint
+        changed: Dict[int, Dict[str, Any]] = {}
+        changed_items: Dict[int, Any] = {}
+        operations = []
+        persisted = []
+        for item in items:
+            item_dict = item.dict()
+            fingerprint = content_fingerprint(item_dict)
+            item_dict["search_tokens"] = tokenize(item.title)
+            if item.tmdb_id:
+                item_dict["content_hash"] = fingerprint
+                if item.tmdb_id in changed:
+                    item_dict["categories"] = list(dict.fromkeys(changed[item.tmdb_id]["categories"] + item_dict["categories"]))
+                changed[item.tmdb_id] = item_dict
+                changed_items[item.tmdb_id] = item
             else:
-                await self.movies.insert_one(movie_dict)
+                operations.append(InsertOne(item_dict))
+                persisted.append(item)
         
-        return movies
+        # Prime fingerprints we have not seen since startup from the stored documents
+        unknown = [tmdb_id for tmdb_id in changed if tmdb_id not in fingerprints]
+        if unknown:
+            cursor = collection.find(
+                {"tmdb_id": {"$in": unknown}, "content_hash": {"$exists": True}},
+                {"_id": 0, "tmdb_id": 1, "content_hash": 1, "categories": 1}
+            )
+            async for doc in cursor:
+                self._remember_fingerprint(name, doc["tmdb_id"], doc["content_hash"], doc.get("categories") or [])
+        
+        skipped = 0
+        for tmdb_id, item_dict in list(changed.items()):
+            known = fingerprints.get(tmdb_id)
+            if known is not None and known[0] == item_dict["content_hash"] and known[1].issuperset(item_dict["categories"]):
+                del changed[tmdb_id]
+                skipped += 1
+                continue
+            
+            # Update existing or insert new
+            fields = {k: v for k, v in item_dict.items() if k != "categories"}
+            operations.append(UpdateOne(
+                {"tmdb_id": tmdb_id},
+                {"$set": fields, "$addToSet": {"categories": {"$each": item_dict["categories"]}}},
+                upsert=True
+            ))
+        
+        counts = await self._bulk_write(collection, operations)
+        for tmdb_id, item_dict in changed.items():
+            self._remember_fingerprint(name, tmdb_id, item_dict["content_hash"], item_dict["categories"])
+            persisted.append(changed_items[tmdb_id])
+        
+        for listener in self._save_listeners:
+            try:
+                listener(name, persisted)
+            except Exception as e:
+                logger.error(f"Save listener failed for {name}: {str(e)}")
+        
+        counts["skipped"] = skipped
+        self.write_stats[name]["written"] += len(operations)
+        self.write_stats[name]["skipped"] += skipped
+        return counts
     
-    async def get_movies_by_category(self, category: str, limit: int = 20) -> List[Movie]:
-        """Get movies by category"""
-        cursor = self.movies.find({"categories": category}).limit(limit)
+    def get_stats(self) -> Dict[str, Any]:
+        """Write statistics, including upserts avoided by change detection"""
+        return {
+            "writes": {
+                name: dict(stats, fingerprints=len(self._fingerprints[name]))
+                for name, stats in self.write_stats.items()
+            },
+            "indexes": self.index_report,
+            "user_cache": self._user_cache.get_stats()
+        }
+    
+    # Movies operations
+    async def save_movies(self, movies: List[Movie]) -> Dict[str, int]:
+        """Save movies to database (upsert based on tmdb_id, unchanged movies are skipped)"""
+        return await self._upsert_catalog("movies", movies)
+    
+    async def get_movies_by_category(self, category: str, limit: int = 20, card: bool = False) -> List[Any]:
+        """Get movies by category (as ContentCards when card=True)"""
+        model = ContentCard if card else Movie
+        cursor = self.movies.find({"categories": category}, _CARD_PROJECTION if card else _CATALOG_PROJECTION).limit(limit)
         movies = []
         
         async for movie_doc in cursor:
-            movies.append(Movie(**movie_doc))
+            movies.append(_from_doc(model, movie_doc))
         
         return movies
     
+    async def iter_catalog(self, name: str, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every raw document of the movies or series collection (the caller validates)"""
+        cursor = getattr(self, name).find({}, _CATALOG_PROJECTION).batch_size(batch_size)
+        async for doc in cursor:
+            yield doc
+    
     # Series operations
-    async def save_series(self, series_list: List[Series]) -> List[Series]:
-        """Save series to database (upsert based on tmdb_id)"""
-        for series in series_list:
-            series_dict = series.dict()
-            if series.tmdb_id:
-                await self.series.update_one(
-                    {"tmdb_id": series.tmdb_id},
-                    {"$set": series_dict},
-                    upsert=True
-                )
-            else:
-                await self.series.insert_one(series_dict)
-        
-        return series_list
+    async def save_series(self, series_list: List[Series]) -> Dict[str, int]:
+        """Save series to database (upsert based on tmdb_id, unchanged series are skipped)"""
+        return await self._upsert_catalog("series", series_list)
     
-    async def get_series_by_category(self, category: str, limit: int = 20) -> List[Series]:
-        """Get series by category"""
-        cursor = self.series.find({"categories": category}).limit(limit)
+    async def get_series_by_category(self, category: str, limit: int = 20, card: bool = False) -> List[Any]:
+        """Get series by category (as ContentCards when card=True)"""
+        model = ContentCard if card else Series
+        cursor = self.series.find({"categories": category}, _CARD_PROJECTION if card else _CATALOG_PROJECTION).limit(limit)
         series_list = []
         
         async for series_doc in cursor:
-            series_list.append(Series(**series_doc))
+            series_list.append(_from_doc(model, series_doc))
         
         return series_list
     
     # Sports operations
-    async def save_sports_events(self, events: List[Sports]) -> List[Sports]:
+    async def save_sports_events(self, events: List[Sports]) -> Dict[str, int]:
         """Save sports events to database"""
-        for event in events:
-            event_dict = event.dict()
-            await self.sports.update_one(
+        operations = [
+            UpdateOne(
                 {"title": event.title, "start_time": event.start_time},
-                {"$set": event_dict},
+                {"$set": event.dict()},
                 upsert=True
             )
+            for event in events
+        ]
         
-        return events
+        return await self._bulk_write(self.sports, operations)
     
     async def get_sports_by_status(self, status: str, limit: int = 20) -> List[Sports]:
         """Get sports events by status"""
-        cursor = self.sports.find({"status": status}).limit(limit)
+        cursor = self.sports.find({"status": status}, {"_id": 0}).limit(limit)
         events = []
         
         async for event_doc in cursor:
@@ -137,19 +417,56 @@ class Database:
         return events
     
     # Watchlist operations
-    async def add_to_watchlist(self, watchlist_item: WatchlistItem) -> WatchlistItem:
-        """Add item to user's watchlist"""
-        # Check if already exists
-        existing = await self.watchlist.find_one({
-            "user_id": watchlist_item.user_id,
-            "content_id": watchlist_item.content_id
-        })
+    # The watchlist collection is the source of truth; users.watchlist mirrors
+    # its content ids so profile reads need no second query.
+    async def add_to_watchlist(self, watchlist_item: WatchlistItem) -> bool:
+        """Add item to user's watchlist; returns False if it was already there"""
+        try:
+            result = await self.watchlist.update_one(
+                {"user_id": watchlist_item.user_id, "content_id": watchlist_item.content_id},
+                {"$setOnInsert": watchlist_item.dict()},
+                upsert=True
+            )
+            added = result.upserted_id is not None
+        except DuplicateKeyError:
+            # A concurrent request inserted the same pair first
+            added = False
+        
+        await self.users.update_one(
+            {"id": watchlist_item.user_id},
+            {"$addToSet": {"watchlist": watchlist_item.content_id}}
+        )
+        self.invalidate_user(watchlist_item.user_id)
+        return added
+    
+    async def add_to_watchlist_batch(self, user_id: str, items: List[WatchlistItem]) -> int:
+        """Add several items in one bulk upsert; returns how many were new"""
+        if not items:
+            return 0
         
-        if not existing:
-            item_dict = watchlist_item.dict()
-            await self.watchlist.insert_one(item_dict)
+        operations = [
+            UpdateOne(
+                {"user_id": user_id, "content_id": item.content_id},
+                {"$setOnInsert": item.dict()},
+                upsert=True
+            )
+            for item in items
+        ]
+        try:
+            counts = await self._bulk_write(self.watchlist, operations)
+            added = counts["upserted"]
+        except BulkWriteError as e:
+            # Duplicate pairs raced in by concurrent requests are already present
+            added = e.details.get("nUpserted", 0)
+            if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                raise
         
-        return watchlist_item
+        await self.users.update_one(
+            {"id": user_id},
+            {"$addToSet": {"watchlist": {"$each": [item.content_id for item in items]}}}
+        )
+        self.invalidate_user(user_id)
+        return added
     
     async def remove_from_watchlist(self, user_id: str, content_id: str) -> bool:
         """Remove item from user's watchlist"""
@@ -158,8 +475,86 @@ class Database:
             "content_id": content_id
         })
         
+        await self.users.update_one({"id": user_id}, {"$pull": {"watchlist": content_id}})
+        self.invalidate_user(user_id)
         return result.deleted_count > 0
     
+    async def remove_from_watchlist_batch(self, user_id: str, content_ids: List[str]) -> int:
+        """Remove several items at once; returns how many were deleted"""
+        if not content_ids:
+            return 0
+        
+        result = await self.watchlist.delete_many({
+            "user_id": user_id,
+            "content_id": {"$in": content_ids}
+        })
+        
+        await self.users.update_one({"id": user_id}, {"$pull": {"watchlist": {"$in": content_ids}}})
+        self.invalidate_user(user_id)
+        return result.deleted_count
+    
+    async def reconcile_user_watchlist(self, user_id: str) -> List[str]:
+        """Rebuild users.watchlist from the watchlist collection"""
+        cursor = self.watchlist.find({"user_id": user_id}, {"_id": 0, "content_id": 1}).sort(
+            [("added_at", ASCENDING), ("content_id", ASCENDING)]
+        )
+        content_ids = [doc["content_id"] async for doc in cursor]
+        
+        await self.users.update_one({"id": user_id}, {"$set": {"watchlist": content_ids}})
+        self.invalidate_user(user_id)
+        return content_ids
+    
+    async def get_user_watchlist_page(self, user_id: str, limit: int = 20,
+                                      after: Optional[Tuple[datetime, str]] = None) -> Tuple[List[WatchlistItem], bool]:
+        """Get one page of a user's watchlist, newest first.
+        
+        `after` is the (added_at, content_id) of the last item already seen.
+        Returns the items and whether more remain.
+        """
+        query: Dict[str, Any] = {"user_id": user_id}
+        if after is not None:
+            added_at, content_id = after
+            query["$or"] = [
+                {"added_at": {"$lt": added_at}},
+                {"added_at": added_at, "content_id": {"$lt": content_id}}
+            ]
+        
+        cursor = self.watchlist.find(query, {"_id": 0}).sort(
+            [("added_at", DESCENDING), ("content_id", DESCENDING)]
+        ).limit(limit + 1)
+        items = [WatchlistItem(**item_doc) async for item_doc in cursor]
+        return items[:limit], len(items) > limit
+    
+    async def get_catalog_by_content_ids(self, name: str, content_ids: List[str]) -> Dict[str, Any]:
+        """Fetch cached movies or series in one query, keyed by the given content ids.
+        
+        Numeric ids are matched against tmdb_id, anything else against id.
+        """
+        if not content_ids:
+            return {}
+        
+        tmdb_ids = [int(content_id) for content_id in content_ids if content_id.isdigit()]
+        ids = [content_id for content_id in content_ids if not content_id.isdigit()]
+        model = Movie if name == "movies" else Series
+        
+        conditions = []
+        if tmdb_ids:
+            conditions.append({"tmdb_id": {"$in": tmdb_ids}})
+        if ids:
+            conditions.append({"id": {"$in": ids}})
+        
+        cursor = getattr(self, name).find(
+            conditions[0] if len(conditions) == 1 else {"$or": conditions},
+            _CATALOG_PROJECTION
+        )
+        found: Dict[str, Any] = {}
+        async for doc in cursor:
+            item = _from_doc(model, doc)
+            if item.tmdb_id is not None:
+                found[str(item.tmdb_id)] = item
+            found[item.id] = item
+        return {content_id: found[content_id] for content_id in content_ids if content_id in found}
+    
     async def get_user_watchlist(self, user_id: str) -> List[WatchlistItem]:
         """Get user's watchlist"""
         cursor = self.watchlist.find({"user_id": user_id})
@@ -171,29 +566,45 @@ class Database:
         return watchlist
     
     # Search operations
-    async def search_movies(self, query: str, limit: int = 20) -> List[Movie]:
-        """Search movies by title"""
-        cursor = self.movies.find({
-            "title": {"$regex": query, "$options": "i"}
-        }).limit(limit)
+    @staticmethod
+    def _search_query(query: str, prefix: bool) -> Optional[Dict[str, Any]]:
+        """Build an index-backed search filter from the normalized query tokens"""
+        tokens = tokenize(query)
+        if not tokens:
+            return None
         
-        movies = []
-        async for movie_doc in cursor:
-            movies.append(Movie(**movie_doc))
+        if prefix:
+            # Complete words must match exactly, the last (partial) word by prefix
+            conditions: List[Dict[str, Any]] = [{"search_tokens": token} for token in tokens[:-1]]
+            conditions.append({"search_tokens": {"$regex": f"^{re.escape(tokens[-1])}"}})
+            return conditions[0] if len(conditions) == 1 else {"$and": conditions}
         
-        return movies
+        # Tokens contain no quotes or dashes, so they cannot alter $text semantics
+        return {"$text": {"$search": " ".join(tokens)}}
     
-    async def search_series(self, query: str, limit: int = 20) -> List[Series]:
-        """Search series by title"""
-        cursor = self.series.find({
-            "title": {"$regex": query, "$options": "i"}
-        }).limit(limit)
+    async def _search_catalog(self, collection: AsyncIOMotorCollection, query: str, limit: int, prefix: bool) -> List[Dict[str, Any]]:
+        search_filter = self._search_query(query, prefix)
+        if search_filter is None:
+            return []
         
-        series_list = []
-        async for series_doc in cursor:
-            series_list.append(Series(**series_doc))
+        if prefix:
+            cursor = collection.find(search_filter, _CATALOG_PROJECTION).sort("popularity", -1).limit(limit)
+        else:
+            cursor = collection.find(
+                search_filter, {**_CATALOG_PROJECTION, "score": {"$meta": "textScore"}}
+            ).sort([("score", {"$meta": "textScore"})]).limit(limit)
         
-        return series_list
+        return [doc async for doc in cursor]
+    
+    async def search_movies(self, query: str, limit: int = 20, prefix: bool = False) -> List[Movie]:
+        """Search movies by title and description (relevance ranked, or by title prefix)"""
+        docs = await self._search_catalog(self.movies, query, limit, prefix)
+        return [_from_doc(Movie, movie_doc) for movie_doc in docs]
+    
+    async def search_series(self, query: str, limit: int = 20, prefix: bool = False) -> List[Series]:
+        """Search series by title and description (relevance ranked, or by title prefix)"""
+        docs = await self._search_catalog(self.series, query, limit, prefix)
+        return [_from_doc(Series, series_doc) for series_doc in docs]
 
 # Global database instance
 database = Database()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal, Union
 from datetime import datetime
 import uuid
 
@@ -71,6 +71,38 @@ class Sports(BaseModel):
     image: str
     description: Optional[str] = None
 
+# Compact carousel representation; full details are fetched on demand
+class ContentCard(BaseModel):
+    id: str
+    tmdb_id: Optional[int] = None
+    title: str
+    thumbnail: str
+    rating: float
+    year: int
+    genre: List[str] = Field(default_factory=list)
+    duration: Optional[str] = None
+    seasons: Optional[int] = None
+    
+    @classmethod
+    def from_content(cls, item: Union[Movie, Series]) -> "ContentCard":
+        return cls(
+            id=item.id,
+            tmdb_id=item.tmdb_id,
+            title=item.title,
+            thumbnail=item.thumbnail,
+            rating=item.rating,
+            year=item.year,
+            genre=item.genre,
+            duration=getattr(item, "duration", None),
+            seasons=getattr(item, "seasons", None)
+        )
+
+# List routes return full documents or cards
+CatalogView = Literal["full", "card"]
+
+# Framing for streamed category browses
+StreamFormat = Literal["ndjson", "sse"]
+
 # Response Models
 class MovieResponse(BaseModel):
     movies: List[Movie]
@@ -86,6 +118,18 @@ class SportsResponse(BaseModel):
     events: List[Sports]
     total: int
 
+class HomeResponse(BaseModel):
+    movies: Dict[str, List[Movie]]
+    series: Dict[str, List[Series]]
+    sports: List[Sports]
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class HomeCardResponse(BaseModel):
+    movies: Dict[str, List[ContentCard]]
+    series: Dict[str, List[ContentCard]]
+    sports: List[Sports]
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+
 # Watchlist Models
 class WatchlistItem(BaseModel):
     user_id: str
@@ -97,6 +141,23 @@ class WatchlistAdd(BaseModel):
     content_id: str
     content_type: str
 
+class WatchlistBatchAdd(BaseModel):
+    items: List[WatchlistAdd]
+
+class WatchlistBatchRemove(BaseModel):
+    content_ids: List[str]
+
+class WatchlistEntry(BaseModel):
+    content_id: str
+    content_type: str
+    added_at: datetime
+    movie: Optional[Movie] = None
+    series: Optional[Series] = None
+
+class WatchlistPage(BaseModel):
+    items: List[WatchlistEntry]
+    next_cursor: Optional[str] = None
+
 # Search Models
 class SearchRequest(BaseModel):
     query: str
@@ -107,4 +168,16 @@ class SearchResponse(BaseModel):
     movies: List[Movie]
     series: List[Series]
     total: int
-    page: int
\ No newline at end of file
+    page: int
+
+class Suggestion(BaseModel):
+    id: str
+    tmdb_id: Optional[int] = None
+    title: str
+    year: int
+    thumbnail: str
+    content_type: str  # movie, series
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: List[Suggestion]
\ No newline at end of file
@@ -1,22 +1,38 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, Header
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
+import asyncio
+import base64
+import functools
+import hmac
 import logging
 from pathlib import Path
-from typing import List, Optional, Annotated
+from typing import Any, Dict, List, Optional, Union, Annotated
 from datetime import datetime
 
 # Import our models and services
 from models import (
     Movie, Series, Sports, User, UserCreate, UserLogin, UserResponse, 
-    WatchlistAdd, WatchlistItem, SearchRequest, SearchResponse,
-    MovieResponse, SeriesResponse, SportsResponse
+    WatchlistAdd, WatchlistBatchAdd, WatchlistBatchRemove, WatchlistItem, WatchlistEntry, WatchlistPage, SearchRequest, SearchResponse, SuggestResponse,
+    MovieResponse, SeriesResponse, SportsResponse, HomeResponse, HomeCardResponse, ContentCard, CatalogView, StreamFormat
 )
 from services.tmdb_service import TMDBService
+from services.category_registry import CATEGORIES, Category
 from services.sports_service import SportsService
 from services.auth_service import AuthService
+from services.password_service import PasswordHasherBusy
+from services.rate_limit_service import RateLimitService, RateLimitExceeded
+from services.cache import SingleFlight, TTLCache
+from services.write_behind_service import WriteBehindService
+from services.search_index_service import SearchIndexService
+from services.suggest_service import SuggestService
+from services.details_service import DetailsService
+from services.prefetch_service import PrefetchService
+from services.response_cache import ResponseCache, ResponseCacheMiddleware
+from services.serialization import FAST_SERIALIZATION, DefaultResponse, JSONBytesResponse, dump_json, json_response
 from database import database
 
 ROOT_DIR = Path(__file__).parent
@@ -27,15 +43,67 @@ TMDB_API_KEY = "c8dea14dc917687ac631a52620e4f7ad"  # Using provided TMDB key
 tmdb_service = TMDBService(TMDB_API_KEY)
 sports_service = SportsService()
 auth_service = AuthService()
+write_behind = WriteBehindService(database)
+search_index = SearchIndexService()
+database.add_save_listener(search_index.on_catalog_saved)
+suggest_service = SuggestService(tmdb_service, search_index, database)
+rate_limiter = RateLimitService()
+details_service = DetailsService(tmdb_service, database, write_behind)
+
+# Home feed: every row is built concurrently and the whole payload is cached
+HOME_ROW_TIMEOUT = float(os.environ.get('HOME_ROW_TIMEOUT', 3.0))
+HOME_CACHE_TTL = int(os.environ.get('HOME_CACHE_TTL', 60))
+home_cache = TTLCache(maxsize=4, default_ttl=HOME_CACHE_TTL)
+home_flight = SingleFlight()
+
+# Home rows come from the category registry, in registry order
+HOME_MOVIE_ROWS = {c.home_row: c for c in CATEGORIES.values() if c.home_row and c.kind == "movie"}
+HOME_SERIES_ROWS = {c.home_row: c for c in CATEGORIES.values() if c.home_row and c.kind == "series"}
+
+# Every category is refreshed ahead of its TMDB cache expiry
+prefetcher = PrefetchService(tmdb_service, write_behind)
+for category in CATEGORIES.values():
+    prefetcher.add_job(
+        category.path,
+        functools.partial(tmdb_service.get_category, category.name),
+        category.kind,
+        category.ttl,
+        pages=category.prefetch_pages
+    )
+
+# Serialized category payloads, keyed by (category, page, view)
+ROW_PAYLOAD_TTL = float(os.environ.get('ROW_PAYLOAD_TTL', 30))
+row_payloads = TTLCache(maxsize=512, default_ttl=ROW_PAYLOAD_TTL)
+
+# Watchlist page and batch sizes
+WATCHLIST_PAGE_LIMIT = 100
+WATCHLIST_BATCH_LIMIT = 100
+
+# Maximum ids accepted by the batch details endpoints
+DETAILS_BATCH_LIMIT = 50
+
+# Streamed category browses: page limit and TMDB pages fetched ahead
+STREAM_MAX_PAGES = int(os.environ.get('STREAM_MAX_PAGES', 25))
+STREAM_WINDOW = int(os.environ.get('STREAM_WINDOW', 4))
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+# Search: shared deadline for all sources and rank-fusion constant
+SEARCH_DEADLINE = float(os.environ.get('SEARCH_DEADLINE', 2.5))
+SEARCH_RRF_K = 60
+SEARCH_MERGE_LIMIT = 100
+
+# Operational metrics are served only when a bearer token is configured
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
 
 # Create the main app
-app = FastAPI(title="StreamFlix API", version="1.0.0")
+app = FastAPI(title="StreamFlix API", version="1.0.0", default_response_class=DefaultResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # Security
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 # Configure logging
 logging.basicConfig(
@@ -57,29 +125,134 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except Exception:
         return None
 
-# Optional auth dependency (doesn't raise error if no token)
-async def get_current_user_optional(authorization: Optional[str] = Header(None)) -> Optional[User]:
-    """Get current user from JWT token (optional)"""
-    if not authorization or not authorization.startswith("Bearer "):
-        return None
-    
+# Dependency guarding operational endpoints
+async def require_metrics_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    """Allow the request only with the configured METRICS_TOKEN; hidden when none is set"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if credentials is None or not hmac.compare_digest(credentials.credentials.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+# Rate limiting for credential endpoints (runs before any lookup or hashing)
+async def enforce_rate_limit(scope: str, key: str):
     try:
-        token = authorization.split(" ")[1]
-        user_id = auth_service.get_current_user_id(token)
-        if user_id:
-            user = await database.get_user_by_id(user_id)
-            return user
-        return None
-    except Exception:
-        return None
+        await rate_limiter.hit(scope, key)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many attempts, please try again later",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+def _client_ip(request: Request) -> str:
+    return rate_limiter.client_ip(
+        request.client.host if request.client else None,
+        request.headers.get("forwarded"),
+        request.headers.get("x-forwarded-for")
+    )
+
+async def limit_login_by_ip(request: Request):
+    await enforce_rate_limit("login_ip", _client_ip(request))
+
+async def limit_register_by_ip(request: Request):
+    await enforce_rate_limit("register_ip", _client_ip(request))
 
 # Health check endpoint
 @api_router.get("/")
 async def root():
     return {"message": "StreamFlix API is running", "version": "1.0.0"}
 
+# Home feed
+def _as_view(items: List[Any], view: CatalogView) -> List[Any]:
+    """Convert full movies/series to cards for view=card"""
+    if view == "card":
+        return [item if isinstance(item, ContentCard) else ContentCard.from_content(item) for item in items]
+    return items
+
+def _enqueue_category(category: Category, items: List[Any]):
+    if category.kind == "movie":
+        write_behind.enqueue_movies(items)
+    else:
+        write_behind.enqueue_series(items)
+
+async def _category_from_database(category: Category, view: CatalogView, limit: int = 20) -> List[Any]:
+    if category.kind == "movie":
+        items = await database.get_movies_by_category(category.fallback, limit, card=view == "card")
+    else:
+        items = await database.get_series_by_category(category.fallback, limit, card=view == "card")
+    # Mock rows are never persisted, so serve them directly
+    if not items and category.mock_rows:
+        items = _as_view(tmdb_service.mock_items(category), view)
+    return items
+
+async def _build_category_row(category: Category, view: CatalogView) -> List[Any]:
+    """Fetch one home row, degrading to the database copy on error or timeout"""
+    try:
+        items = await asyncio.wait_for(tmdb_service.get_category(category.name), HOME_ROW_TIMEOUT)
+        if items:
+            _enqueue_category(category, items)
+            return _as_view(items, view)
+    except Exception as e:
+        logger.warning(f"Home row {category.path} degraded to database: {e!r}")
+    
+    try:
+        return await _category_from_database(category, view)
+    except Exception as e:
+        logger.error(f"Home row {category.path} fallback failed: {str(e)}")
+        return []
+
+async def _build_sports_row() -> List[Sports]:
+    try:
+        events = await asyncio.wait_for(sports_service.get_all_sports_content(), HOME_ROW_TIMEOUT)
+        write_behind.enqueue_sports_events(events)
+        return events
+    except Exception as e:
+        logger.error(f"Home row sports failed: {e!r}")
+        return []
+
+async def _build_home_feed(view: CatalogView):
+    movie_names = list(HOME_MOVIE_ROWS)
+    series_names = list(HOME_SERIES_ROWS)
+    
+    rows = await asyncio.gather(
+        *(_build_category_row(HOME_MOVIE_ROWS[name], view) for name in movie_names),
+        *(_build_category_row(HOME_SERIES_ROWS[name], view) for name in series_names),
+        _build_sports_row()
+    )
+    
+    movie_rows = rows[:len(movie_names)]
+    series_rows = rows[len(movie_names):len(movie_names) + len(series_names)]
+    
+    response_model = HomeCardResponse if view == "card" else HomeResponse
+    feed = response_model(
+        movies=dict(zip(movie_names, movie_rows)),
+        series=dict(zip(series_names, series_rows)),
+        sports=rows[-1]
+    )
+    # Cached pre-serialized in fast mode, so hits skip validation and encoding
+    cached = dump_json(feed) if FAST_SERIALIZATION else feed
+    home_cache.set(view, cached)
+    return cached
+
+@api_router.get("/home", response_model=Union[HomeResponse, HomeCardResponse])
+async def get_home_feed(response: Response, view: CatalogView = "full"):
+    """Get every home page row in a single response (view=card for carousel cards)"""
+    cache_control = f"public, max-age={HOME_CACHE_TTL}"
+    
+    feed = home_cache.get(view)
+    if feed is None:
+        feed = await home_flight.do(view, lambda: _build_home_feed(view))
+    if FAST_SERIALIZATION:
+        return JSONBytesResponse(feed, headers={"Cache-Control": cache_control})
+    response.headers["Cache-Control"] = cache_control
+    return feed
+
 # Authentication routes
-@api_router.post("/auth/register", response_model=dict)
+@api_router.post("/auth/register", response_model=dict, dependencies=[Depends(limit_register_by_ip)])
 async def register_user(user_data: UserCreate):
     """Register a new user"""
     try:
@@ -89,7 +262,7 @@ async def register_user(user_data: UserCreate):
             raise HTTPException(status_code=400, detail="Email already registered")
         
         # Create new user
-        hashed_password = auth_service.hash_password(user_data.password)
+        hashed_password = await auth_service.hash_password(user_data.password)
         user = User(
             email=user_data.email,
             name=user_data.name,
@@ -115,23 +288,37 @@ async def register_user(user_data: UserCreate):
         }
     except HTTPException:
         raise
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Registration error: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@api_router.post("/auth/login", response_model=dict)
+@api_router.post("/auth/login", response_model=dict, dependencies=[Depends(limit_login_by_ip)])
 async def login_user(login_data: UserLogin):
     """Login user"""
+    await enforce_rate_limit("login_email", login_data.email.lower())
+    
     try:
         # Find user
         user = await database.get_user_by_email(login_data.email)
         if not user:
+            # Same scrypt cost as a wrong password, so timing does not reveal which emails exist
+            await auth_service.verify_missing_user_password(login_data.password)
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         # Verify password
-        if not auth_service.verify_password(login_data.password, user.password_hash):
+        if not await auth_service.verify_password(login_data.password, user.password_hash):
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
+        # Upgrade legacy or outdated hashes now that we know the password
+        if auth_service.password_needs_rehash(user.password_hash):
+            new_hash = await auth_service.hash_password(login_data.password)
+            await database.update_user_password_hash(user.id, new_hash)
+        
+        # Repair any drift between users.watchlist and the watchlist collection
+        user.watchlist = await database.reconcile_user_watchlist(user.id)
+        
         # Create access token
         access_token = auth_service.create_access_token(user.id, user.email)
         
@@ -148,129 +335,152 @@ async def login_user(login_data: UserLogin):
         }
     except HTTPException:
         raise
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-# Movie routes
-@api_router.get("/movies/trending", response_model=List[Movie])
-async def get_trending_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get trending movies"""
-    try:
-        movies = await tmdb_service.get_trending_movies(page)
-        # Save to database for future reference
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching trending movies: {str(e)}")
-        # Fallback to database if API fails
-        return await database.get_movies_by_category("trending", 20)
-
-@api_router.get("/movies/popular", response_model=List[Movie])
-async def get_popular_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get popular movies"""
-    try:
-        movies = await tmdb_service.get_popular_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching popular movies: {str(e)}")
-        return await database.get_movies_by_category("popular", 20)
-
-@api_router.get("/movies/hindi", response_model=List[Movie])
-async def get_hindi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get Hindi movies"""
-    try:
-        movies = await tmdb_service.get_hindi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching Hindi movies: {str(e)}")
-        return await database.get_movies_by_category("hindi", 20)
-
-@api_router.get("/movies/hindi/old", response_model=List[Movie])
-async def get_old_hindi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get old Hindi movies"""
-    try:
-        movies = await tmdb_service.get_old_hindi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching old Hindi movies: {str(e)}")
-        return await database.get_movies_by_category("old_hindi", 20)
-
-@api_router.get("/movies/hindi/trending", response_model=List[Movie])
-async def get_trending_hindi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get trending Hindi movies"""
-    try:
-        movies = await tmdb_service.get_trending_hindi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching trending Hindi movies: {str(e)}")
-        return await database.get_movies_by_category("trending_hindi", 20)
-
-@api_router.get("/movies/punjabi", response_model=List[Movie])
-async def get_punjabi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get Punjabi movies"""
+# Category routes: one pipeline serves every registry entry
+async def _fetch_category(category: Category, page: int, view: CatalogView) -> List[Any]:
+    """Fetch one category page, falling back to the database copy if TMDB fails"""
     try:
-        movies = await tmdb_service.get_punjabi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
+        items = await tmdb_service.get_category(category.name, page)
+        # Persist in the background for future reference
+        if items:
+            _enqueue_category(category, items)
+        return _as_view(items, view)
     except Exception as e:
-        logger.error(f"Error fetching Punjabi movies: {str(e)}")
-        return await database.get_movies_by_category("punjabi", 20)
+        logger.error(f"Error fetching {category.title}: {str(e)}")
+        return await _category_from_database(category, view)
 
-@api_router.get("/movies/punjabi/old", response_model=List[Movie])
-async def get_old_punjabi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get old Punjabi movies"""
+async def _serve_category(category: Category, page: int, view: CatalogView):
+    """Serve a category page from pre-serialized JSON bytes in fast mode.
+    
+    TMDB is called only on a payload cache miss; the result is serialized
+    once and never re-validated against the response model.
+    """
+    if not FAST_SERIALIZATION:
+        return await _fetch_category(category, page, view)
+    
+    key = (category.name, page, view)
+    payload = row_payloads.get(key)
+    if payload is None:
+        items = await _fetch_category(category, page, view)
+        payload = dump_json(items)
+        if items:
+            row_payloads.set(key, payload)
+    return JSONBytesResponse(payload)
+
+@api_router.get("/categories", response_model=List[dict])
+async def list_categories():
+    """List every browsable category"""
+    return [
+        {"name": category.name, "kind": category.kind, "title": category.title, "path": f"/api/{category.path}"}
+        for category in CATEGORIES.values()
+    ]
+
+@api_router.get("/categories/{name}", response_model=Union[List[Movie], List[Series], List[ContentCard]])
+async def get_category(name: str, page: int = 1, view: CatalogView = "full"):
+    """Get one page of any category by name"""
+    category = CATEGORIES.get(name)
+    if category is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return await _serve_category(category, page, view)
+
+async def _stream_category_items(category: Category, pages: int, view: CatalogView):
+    """Items of a category's first pages, one at a time, as each page arrives"""
+    async for items in tmdb_service.iter_category_pages(category.name, pages, STREAM_WINDOW):
+        _enqueue_category(category, items)
+        for item in _as_view(items, view):
+            yield item
+
+def _frame(stream_format: StreamFormat, event: str, payload: Any) -> bytes:
+    if stream_format == "sse":
+        return b"event: " + event.encode() + b"\ndata: " + dump_json(payload) + b"\n\n"
+    return dump_json(payload) + b"\n"
+
+async def _encode_category_stream(category: Category, pages: int, view: CatalogView, stream_format: StreamFormat):
+    """Frame streamed items as NDJSON lines or SSE events.
+    
+    An upstream failure ends the stream with an error record; SSE streams
+    also close with an end event carrying the item count.
+    """
+    count = 0
     try:
-        movies = await tmdb_service.get_old_punjabi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
+        async for item in _stream_category_items(category, pages, view):
+            count += 1
+            yield _frame(stream_format, "item", item)
     except Exception as e:
-        logger.error(f"Error fetching old Punjabi movies: {str(e)}")
-        return await database.get_movies_by_category("old_punjabi", 20)
+        logger.error(f"Error streaming {category.title} after {count} items: {str(e)}")
+        yield _frame(stream_format, "error", {"error": "Upstream fetch failed", "items": count})
+        return
+    
+    if stream_format == "sse":
+        yield _frame(stream_format, "end", {"items": count})
+
+@api_router.get("/categories/{name}/stream")
+async def stream_category(
+    name: str,
+    pages: int = 5,
+    view: CatalogView = "full",
+    stream_format: StreamFormat = Query("ndjson", alias="format")
+):
+    """Stream several pages of a category as NDJSON or server-sent events"""
+    category = CATEGORIES.get(name)
+    if category is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if not 1 <= pages <= STREAM_MAX_PAGES:
+        raise HTTPException(status_code=400, detail=f"pages must be between 1 and {STREAM_MAX_PAGES}")
+    
+    return StreamingResponse(
+        _encode_category_stream(category, pages, view, stream_format),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-@api_router.get("/movies/punjabi/trending", response_model=List[Movie])
-async def get_trending_punjabi_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get trending Punjabi movies"""
-    try:
-        movies = await tmdb_service.get_trending_punjabi_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching trending Punjabi movies: {str(e)}")
-        return await database.get_movies_by_category("trending_punjabi", 20)
+def _category_route(category: Category):
+    async def route(page: int = 1, view: CatalogView = "full"):
+        return await _serve_category(category, page, view)
+    route.__doc__ = f"Get {category.title}"
+    return route
+
+# Each category keeps its original path (e.g. /movies/hindi/old); registered
+# before /movies/{movie_id} and /series/{series_id} so those do not shadow it
+for category in CATEGORIES.values():
+    api_router.add_api_route(
+        f"/{category.path}",
+        _category_route(category),
+        methods=["GET"],
+        response_model=Union[List[Movie if category.kind == "movie" else Series], List[ContentCard]],
+        name=f"get_{category.path.replace('/', '_')}"
+    )
 
-@api_router.get("/movies/anime", response_model=List[Movie])
-async def get_anime_movies(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get anime movies"""
+# Movie routes
+def _parse_batch_ids(ids: str) -> List[int]:
     try:
-        movies = await tmdb_service.get_anime_movies(page)
-        if movies:
-            await database.save_movies(movies)
-        return movies
-    except Exception as e:
-        logger.error(f"Error fetching anime movies: {str(e)}")
-        return await database.get_movies_by_category("anime", 20)
+        tmdb_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if len(tmdb_ids) > DETAILS_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {DETAILS_BATCH_LIMIT} ids per request")
+    return tmdb_ids
+
+@api_router.get("/movies/batch", response_model=List[Movie])
+async def get_movies_batch(ids: str):
+    """Get details for several movies (comma-separated TMDB ids), in request order"""
+    tmdb_ids = _parse_batch_ids(ids)
+    found = await details_service.get_many("movie", tmdb_ids)
+    return json_response([found[tmdb_id] for tmdb_id in dict.fromkeys(tmdb_ids) if tmdb_id in found])
 
 @api_router.get("/movies/{movie_id}", response_model=Movie)
-async def get_movie_details(movie_id: int, current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_movie_details(movie_id: int):
     """Get movie details"""
     try:
-        movie = await tmdb_service.get_movie_details(movie_id)
+        movie = await details_service.get_movie(movie_id)
         if not movie:
             raise HTTPException(status_code=404, detail="Movie not found")
-        return movie
+        return json_response(movie)
     except HTTPException:
         raise
     except Exception as e:
@@ -278,38 +488,21 @@ async def get_movie_details(movie_id: int, current_user: Optional[User] = Depend
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Series routes
-@api_router.get("/series/trending", response_model=List[Series])
-async def get_trending_series(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get trending TV series"""
-    try:
-        series_list = await tmdb_service.get_trending_series(page)
-        if series_list:
-            await database.save_series(series_list)
-        return series_list
-    except Exception as e:
-        logger.error(f"Error fetching trending series: {str(e)}")
-        return await database.get_series_by_category("series", 20)
-
-@api_router.get("/series/web", response_model=List[Series])
-async def get_web_series(page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """Get popular web series"""
-    try:
-        series_list = await tmdb_service.get_web_series(page)
-        if series_list:
-            await database.save_series(series_list)
-        return series_list
-    except Exception as e:
-        logger.error(f"Error fetching web series: {str(e)}")
-        return await database.get_series_by_category("web_series", 20)
+@api_router.get("/series/batch", response_model=List[Series])
+async def get_series_batch(ids: str):
+    """Get details for several series (comma-separated TMDB ids), in request order"""
+    tmdb_ids = _parse_batch_ids(ids)
+    found = await details_service.get_many("series", tmdb_ids)
+    return json_response([found[tmdb_id] for tmdb_id in dict.fromkeys(tmdb_ids) if tmdb_id in found])
 
 @api_router.get("/series/{series_id}", response_model=Series)
-async def get_series_details(series_id: int, current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_series_details(series_id: int):
     """Get series details"""
     try:
-        series = await tmdb_service.get_series_details(series_id)
+        series = await details_service.get_series(series_id)
         if not series:
             raise HTTPException(status_code=404, detail="Series not found")
-        return series
+        return json_response(series)
     except HTTPException:
         raise
     except Exception as e:
@@ -318,83 +511,111 @@ async def get_series_details(series_id: int, current_user: Optional[User] = Depe
 
 # Sports routes
 @api_router.get("/sports/live", response_model=List[Sports])
-async def get_live_sports(current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_live_sports():
     """Get live sports events"""
     try:
         events = await sports_service.get_live_sports()
-        await database.save_sports_events(events)
+        write_behind.enqueue_sports_events(events)
         return events
     except Exception as e:
         logger.error(f"Error fetching live sports: {str(e)}")
         return []
 
 @api_router.get("/sports/highlights", response_model=List[Sports])
-async def get_sports_highlights(current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_sports_highlights():
     """Get sports highlights"""
     try:
         events = await sports_service.get_highlights()
-        await database.save_sports_events(events)
+        write_behind.enqueue_sports_events(events)
         return events
     except Exception as e:
         logger.error(f"Error fetching sports highlights: {str(e)}")
         return []
 
 @api_router.get("/sports/upcoming", response_model=List[Sports])
-async def get_upcoming_sports(current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_upcoming_sports():
     """Get upcoming sports events"""
     try:
         events = await sports_service.get_upcoming_events()
-        await database.save_sports_events(events)
+        write_behind.enqueue_sports_events(events)
         return events
     except Exception as e:
         logger.error(f"Error fetching upcoming sports: {str(e)}")
         return []
 
 @api_router.get("/sports/all", response_model=List[Sports])
-async def get_all_sports_content(current_user: Optional[User] = Depends(get_current_user_optional)):
+async def get_all_sports_content():
     """Get all sports content (live + highlights + upcoming)"""
     try:
         events = await sports_service.get_all_sports_content()
-        await database.save_sports_events(events)
+        write_behind.enqueue_sports_events(events)
         return events
     except Exception as e:
         logger.error(f"Error fetching all sports content: {str(e)}")
         return []
 
 # Search routes
+def _merge_ranked(*ranked_lists: List, limit: int) -> List:
+    """Merge ranked result lists by reciprocal rank fusion, deduplicating by tmdb_id.
+    
+    Titles found by several sources rise to the top; earlier lists win ties.
+    """
+    scores = {}
+    items = {}
+    for ranked in ranked_lists:
+        for rank, item in enumerate(ranked):
+            key = item.tmdb_id or item.id
+            scores[key] = scores.get(key, 0.0) + 1.0 / (SEARCH_RRF_K + rank)
+            items.setdefault(key, item)
+    
+    ordered = sorted(scores, key=scores.get, reverse=True)
+    return [items[key] for key in ordered[:limit]]
+
 @api_router.get("/search", response_model=SearchResponse)
-async def search_content(q: str, page: int = 1, current_user: Optional[User] = Depends(get_current_user_optional)):
+async def search_content(q: str, page: int = 1):
     """Search movies and TV shows"""
-    try:
-        # Search via TMDB API
-        movies, series_list = await tmdb_service.search_content(q, page)
-        
-        # Also search local database
-        db_movies = await database.search_movies(q, 10)
-        db_series = await database.search_series(q, 10)
-        
-        # Combine results (remove duplicates by tmdb_id)
-        all_movies = movies + [m for m in db_movies if m.tmdb_id not in [movie.tmdb_id for movie in movies]]
-        all_series = series_list + [s for s in db_series if s.tmdb_id not in [series.tmdb_id for series in series_list]]
-        
-        return SearchResponse(
-            movies=all_movies[:20],
-            series=all_series[:20],
-            total=len(all_movies) + len(all_series),
-            page=page
-        )
-    except Exception as e:
-        logger.error(f"Error searching content: {str(e)}")
-        # Fallback to database search only
-        db_movies = await database.search_movies(q, 10)
-        db_series = await database.search_series(q, 10)
-        
-        return SearchResponse(
-            movies=db_movies,
-            series=db_series,
-            total=len(db_movies) + len(db_series),
-            page=page
-        )
+    # TMDB and the local database are queried concurrently under one deadline;
+    # sources that fail or miss the deadline are left out of the results
+    tasks = {
+        "tmdb_movies": asyncio.create_task(tmdb_service.search_movies(q, page)),
+        "tmdb_series": asyncio.create_task(tmdb_service.search_series(q, page)),
+        "db_movies": asyncio.create_task(database.search_movies(q, 10)),
+        "db_series": asyncio.create_task(database.search_series(q, 10))
+    }
+    done, pending = await asyncio.wait(tasks.values(), timeout=SEARCH_DEADLINE)
+    for task in pending:
+        task.cancel()
+    
+    results = {}
+    for name, task in tasks.items():
+        if task not in done:
+            logger.warning(f"Search source {name} missed the {SEARCH_DEADLINE}s deadline")
+        elif task.exception() is not None:
+            logger.error(f"Search source {name} failed: {task.exception()!r}")
+        else:
+            results[name] = task.result()
+    
+    movies = results.get("tmdb_movies", [])
+    series_list = results.get("tmdb_series", [])
+    if not movies and not series_list:
+        # TMDB unavailable or no matches: answer from the in-memory catalog index
+        movies, series_list = search_index.search(q, 20)
+    
+    all_movies = _merge_ranked(movies, results.get("db_movies", []), limit=SEARCH_MERGE_LIMIT)
+    all_series = _merge_ranked(series_list, results.get("db_series", []), limit=SEARCH_MERGE_LIMIT)
+    
+    return json_response(SearchResponse(
+        movies=all_movies[:20],
+        series=all_series[:20],
+        total=len(all_movies) + len(all_series),
+        page=page
+    ))
+
+@api_router.get("/search/suggest", response_model=SuggestResponse)
+async def suggest_content(q: str, limit: int = 10):
+    """Type-ahead suggestions from the prefix cache and local catalog"""
+    suggestions = await suggest_service.suggest(q, min(max(limit, 1), 20))
+    return json_response(SuggestResponse(query=q, suggestions=suggestions))
 
 # Watchlist routes (require authentication)
 @api_router.post("/user/watchlist", response_model=dict)
@@ -416,15 +637,101 @@ async def add_to_watchlist(watchlist_data: WatchlistAdd, current_user: User = De
         logger.error(f"Error adding to watchlist: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@api_router.get("/user/watchlist", response_model=List[WatchlistItem])
-async def get_user_watchlist(current_user: User = Depends(get_current_user)):
-    """Get user's watchlist"""
+@api_router.post("/user/watchlist/batch", response_model=dict)
+async def add_to_watchlist_batch(batch: WatchlistBatchAdd, current_user: User = Depends(get_current_user)):
+    """Add several items to user's watchlist"""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Authentication required")
+    if len(batch.items) > WATCHLIST_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {WATCHLIST_BATCH_LIMIT} items per batch")
+    
+    try:
+        items = [
+            WatchlistItem(user_id=current_user.id, content_id=item.content_id, content_type=item.content_type)
+            for item in batch.items
+        ]
+        added = await database.add_to_watchlist_batch(current_user.id, items)
+        return {"message": "Added to watchlist successfully", "added": added}
+    except Exception as e:
+        logger.error(f"Error adding batch to watchlist: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.post("/user/watchlist/batch/remove", response_model=dict)
+async def remove_from_watchlist_batch(batch: WatchlistBatchRemove, current_user: User = Depends(get_current_user)):
+    """Remove several items from user's watchlist"""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Authentication required")
+    if len(batch.content_ids) > WATCHLIST_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {WATCHLIST_BATCH_LIMIT} items per batch")
+    
+    try:
+        removed = await database.remove_from_watchlist_batch(current_user.id, batch.content_ids)
+        return {"message": "Removed from watchlist successfully", "removed": removed}
+    except Exception as e:
+        logger.error(f"Error removing batch from watchlist: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+def _encode_watchlist_cursor(item: WatchlistItem) -> str:
+    raw = f"{item.added_at.isoformat()}|{item.content_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_watchlist_cursor(cursor: str):
+    try:
+        added_at, content_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(added_at), content_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def _hydrate_watchlist(items: List[WatchlistItem]) -> List[WatchlistEntry]:
+    """Attach movie/series details.
+    
+    TMDB ids go through the details service (memory, then Mongo in one query,
+    then TMDB in parallel); entries saved under our own content id are looked
+    up in the catalog directly.
+    """
+    def ids(content_type: str, numeric: bool) -> List[str]:
+        return [
+            item.content_id for item in items
+            if item.content_type == content_type and item.content_id.isdigit() == numeric
+        ]
+    
+    movies, series_map, catalog_movies, catalog_series = await asyncio.gather(
+        details_service.get_many("movie", [int(content_id) for content_id in ids("movie", True)]),
+        details_service.get_many("series", [int(content_id) for content_id in ids("series", True)]),
+        database.get_catalog_by_content_ids("movies", ids("movie", False)),
+        database.get_catalog_by_content_ids("series", ids("series", False))
+    )
+    
+    def lookup(found: Dict[int, Any], catalog: Dict[str, Any], content_id: str):
+        return found.get(int(content_id)) if content_id.isdigit() else catalog.get(content_id)
+    
+    return [
+        WatchlistEntry(
+            content_id=item.content_id,
+            content_type=item.content_type,
+            added_at=item.added_at,
+            movie=lookup(movies, catalog_movies, item.content_id) if item.content_type == "movie" else None,
+            series=lookup(series_map, catalog_series, item.content_id) if item.content_type == "series" else None
+        )
+        for item in items
+    ]
+
+@api_router.get("/user/watchlist", response_model=WatchlistPage)
+async def get_user_watchlist(limit: int = 20, cursor: Optional[str] = None, current_user: User = Depends(get_current_user)):
+    """Get one page of the user's watchlist with content details, newest first"""
     if not current_user:
         raise HTTPException(status_code=401, detail="Authentication required")
     
+    after = _decode_watchlist_cursor(cursor) if cursor else None
+    limit = min(max(limit, 1), WATCHLIST_PAGE_LIMIT)
+    
     try:
-        watchlist = await database.get_user_watchlist(current_user.id)
-        return watchlist
+        items, has_more = await database.get_user_watchlist_page(current_user.id, limit, after)
+        entries = await _hydrate_watchlist(items)
+        return WatchlistPage(
+            items=entries,
+            next_cursor=_encode_watchlist_cursor(items[-1]) if has_more else None
+        )
     except Exception as e:
         logger.error(f"Error fetching watchlist: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -462,9 +769,37 @@ async def get_user_profile(current_user: User = Depends(get_current_user)):
         created_at=current_user.created_at
     )
 
+# Metrics
+@api_router.get("/metrics", dependencies=[Depends(require_metrics_token)], include_in_schema=False)
+async def get_metrics():
+    """Runtime statistics for upstream connections and caches"""
+    return {
+        "tmdb": {
+            "pool": tmdb_service.get_pool_stats(),
+            "cache": tmdb_service.get_cache_stats(),
+            "upstream": tmdb_service.get_upstream_stats(),
+            "categories": tmdb_service.get_category_stats()
+        },
+        "home_cache": home_cache.get_stats(),
+        "write_behind": write_behind.get_stats(),
+        "database": database.get_stats(),
+        "search_index": search_index.get_stats(),
+        "suggest": suggest_service.get_stats(),
+        "auth": auth_service.get_stats(),
+        "rate_limit": rate_limiter.get_stats(),
+        "details_cache": details_service.get_stats(),
+        "prefetch": prefetcher.get_stats(),
+        "response_cache": response_cache.get_stats()
+    }
+
 # Include the router in the main app
 app.include_router(api_router)
 
+# Anonymous catalog reads are answered from rendered, compressed bytes;
+# added before CORS so cached responses still receive CORS headers
+response_cache = ResponseCache()
+app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -476,12 +811,22 @@ app.add_middleware(
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database connection"""
+    """Initialize database connection, upstream HTTP session, write-behind worker and prefetcher"""
     await database.connect()
+    await tmdb_service.start()
+    await write_behind.start()
+    await prefetcher.start()
+    # Build the search index in the background so startup is not delayed
+    app.state.search_index_load = asyncio.create_task(search_index.load(database))
     logger.info("StreamFlix API started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close database connection"""
+    """Drain pending writes, then close upstream HTTP session and database connection"""
+    app.state.search_index_load.cancel()
+    await prefetcher.stop()
+    await write_behind.stop()
+    await tmdb_service.close()
+    auth_service.passwords.close()
     await database.disconnect()
     logger.info("StreamFlix API shutdown complete")
@@ -1,13 +1,15 @@
-import hashlib
 import jwt
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict, Any
 import os
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import User, UserCreate, UserLogin, UserResponse
+from services.password_service import PasswordService
 
 class AuthService:
     def __init__(self):
@@ -15,14 +17,30 @@ class AuthService:
         self.secret_key = os.environ.get('JWT_SECRET', 'streamflix-secret-key-change-in-production')
         self.algorithm = 'HS256'
         self.access_token_expire = timedelta(days=30)  # 30 days for demo
+        
+        # Verified token -> claims, so repeat requests skip signature checks
+        self.token_cache_size = int(os.environ.get('JWT_CACHE_SIZE', 10000))
+        self._token_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self.token_cache_hits = 0
+        self.token_cache_misses = 0
+        
+        self.passwords = PasswordService()
+    
+    async def hash_password(self, password: str) -> str:
+        """Hash password using scrypt (off the event loop)"""
+        return await self.passwords.hash(password)
     
-    def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        """Verify password against hash (scrypt or legacy SHA-256)"""
+        return await self.passwords.verify(password, hashed_password)
     
-    def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify password against hash"""
-        return self.hash_password(password) == hashed_password
+    async def verify_missing_user_password(self, password: str) -> bool:
+        """Always False, after the same scrypt work as a real verification"""
+        return await self.passwords.verify_dummy(password)
+    
+    def password_needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a stored hash should be upgraded to the current KDF settings"""
+        return self.passwords.needs_rehash(hashed_password)
     
     def create_access_token(self, user_id: str, email: str) -> str:
         """Create JWT access token"""
@@ -38,14 +56,37 @@ class AuthService:
         return token
     
     def decode_token(self, token: str) -> Optional[dict]:
-        """Decode and validate JWT token"""
+        """Decode and validate JWT token (verified claims are cached until they expire)"""
+        payload = self._token_cache.get(token)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                self._token_cache.move_to_end(token)
+                self.token_cache_hits += 1
+                return payload
+            del self._token_cache[token]
+            return None
+        
+        self.token_cache_misses += 1
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except jwt.ExpiredSignatureError:
             return None
-        except jwt.JWTError:
+        except jwt.InvalidTokenError:
             return None
+        
+        if "exp" in payload:
+            self._token_cache[token] = payload
+            while len(self._token_cache) > self.token_cache_size:
+                self._token_cache.popitem(last=False)
+        return payload
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "token_cache_size": len(self._token_cache),
+            "token_cache_hits": self.token_cache_hits,
+            "token_cache_misses": self.token_cache_misses,
+            "password_hashing": self.passwords.get_stats()
+        }
     
     def get_current_user_id(self, token: str) -> Optional[str]:
         """Extract user ID from JWT token"""
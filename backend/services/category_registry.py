@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional
+
+
+class Category:
+    """One catalog row: where it comes from on TMDB and how it is served.
+
+    ``name`` is also the tag stored in each document's ``categories`` list,
+    so it is the key for the database fallback unless ``fallback`` says
+    otherwise. ``mock_rows`` (model field dicts) are served when TMDB
+    returns nothing. ``home_row`` names the row in the /api/home feed, if any.
+    """
+
+    def __init__(self, name: str, kind: str, path: str, title: str, endpoint: str,
+                 params: Optional[Dict[str, Any]] = None, ttl: int = 3600,
+                 fallback: Optional[str] = None, mock_rows: Optional[List[Dict[str, Any]]] = None,
+                 prefetch_pages: Optional[int] = None, home_row: Optional[str] = None):
+        self.name = name
+        self.kind = kind
+        self.path = path
+        self.title = title
+        self.endpoint = endpoint
+        self.params = params or {}
+        self.ttl = ttl
+        self.fallback = fallback or name
+        self.mock_rows = mock_rows
+        self.prefetch_pages = prefetch_pages
+        self.home_row = home_row
+
+
+def _discover_movies(language: Optional[str] = None, **params) -> Dict[str, Any]:
+    if language:
+        params["with_original_language"] = language
+    params.setdefault("sort_by", "popularity.desc")
+    return params
+
+
+# Offline rows for categories whose TMDB results are often empty
+PUNJABI_MOCK_ROWS = [
+    {
+        "title": "Chal Mera Putt",
+        "description": "A comedy-drama about Punjabi immigrants living in the UK and their struggles and friendships.",
+        "year": 2019,
+        "rating": 8.2,
+        "genre": ["Comedy", "Drama"],
+        "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&sat=1.2&hue=30",
+        "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&sat=1.2&hue=30",
+        "duration": "132 min"
+    },
+    {
+        "title": "Qismat",
+        "description": "A romantic drama about love, destiny, and the choices that shape our lives.",
+        "year": 2018,
+        "rating": 8.5,
+        "genre": ["Romance", "Drama"],
+        "thumbnail": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=300&h=400&fit=crop&sat=1.3&hue=350",
+        "backdrop_image": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=1280&h=720&fit=crop&sat=1.3&hue=350",
+        "duration": "141 min"
+    },
+    {
+        "title": "Shadaa",
+        "description": "A comedy about a man in his 30s who is still unmarried and the pressures he faces from family.",
+        "year": 2019,
+        "rating": 7.8,
+        "genre": ["Comedy", "Romance"],
+        "thumbnail": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=300&h=400&fit=crop&sat=1.1&hue=60",
+        "backdrop_image": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=1280&h=720&fit=crop&sat=1.1&hue=60",
+        "duration": "127 min"
+    }
+]
+
+OLD_PUNJABI_MOCK_ROWS = [
+    {
+        "title": "Maula Jatt",
+        "description": "Classic Punjabi action film about a legendary warrior and his battles.",
+        "year": 1979,
+        "rating": 8.0,
+        "genre": ["Action", "Drama"],
+        "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&sat=0.8&contrast=1.2",
+        "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&sat=0.8&contrast=1.2",
+        "duration": "135 min"
+    },
+    {
+        "title": "Putt Jattan De",
+        "description": "A classic family drama showcasing Punjabi culture and traditions.",
+        "year": 1982,
+        "rating": 7.5,
+        "genre": ["Drama", "Family"],
+        "thumbnail": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=300&h=400&fit=crop&sat=0.7&sepia=0.3",
+        "backdrop_image": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=1280&h=720&fit=crop&sat=0.7&sepia=0.3",
+        "duration": "142 min"
+    }
+]
+
+TRENDING_PUNJABI_MOCK_ROWS = [
+    {
+        "title": "Honsla Rakh",
+        "description": "A modern comedy-drama starring Diljit Dosanjh about single parenthood and love.",
+        "year": 2021,
+        "rating": 8.1,
+        "genre": ["Comedy", "Romance"],
+        "thumbnail": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=300&h=400&fit=crop&brightness=1.1&hue=45",
+        "backdrop_image": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=1280&h=720&fit=crop&brightness=1.1&hue=45",
+        "duration": "145 min"
+    },
+    {
+        "title": "Sufna",
+        "description": "A romantic drama about dreams, aspirations, and the journey of love.",
+        "year": 2020,
+        "rating": 8.3,
+        "genre": ["Romance", "Drama"],
+        "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&hue=320&sat=1.2",
+        "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&hue=320&sat=1.2",
+        "duration": "130 min"
+    }
+]
+
+
+# Every TMDB-backed row, in home page order. Adding a row here gives it a
+# route, caching, request coalescing, prefetching, metrics and a database fallback.
+CATEGORIES: Dict[str, Category] = {category.name: category for category in [
+    Category("trending", "movie", "movies/trending", "trending movies", "trending/movie/week",
+             ttl=900, prefetch_pages=2, home_row="trending"),
+    Category("popular", "movie", "movies/popular", "popular movies", "movie/popular",
+             ttl=1800, prefetch_pages=2, home_row="popular"),
+    Category("hindi", "movie", "movies/hindi", "Hindi movies", "discover/movie",
+             _discover_movies("hi"), ttl=3600, home_row="hindi"),
+    Category("old_hindi", "movie", "movies/hindi/old", "old Hindi movies (before 2000)", "discover/movie",
+             _discover_movies("hi", **{"primary_release_date.lte": "2000-12-31"}),
+             ttl=86400, prefetch_pages=1, home_row="old_hindi"),
+    Category("trending_hindi", "movie", "movies/hindi/trending", "trending Hindi movies", "discover/movie",
+             _discover_movies("hi", sort_by="vote_average.desc", **{"primary_release_date.gte": "2020-01-01"}),
+             ttl=3600, home_row="trending_hindi"),
+    Category("punjabi", "movie", "movies/punjabi", "Punjabi movies", "discover/movie",
+             _discover_movies("pa"), ttl=3600, mock_rows=PUNJABI_MOCK_ROWS, home_row="punjabi"),
+    Category("old_punjabi", "movie", "movies/punjabi/old", "old Punjabi movies", "discover/movie",
+             _discover_movies("pa", **{"primary_release_date.lte": "2010-12-31"}),
+             ttl=86400, mock_rows=OLD_PUNJABI_MOCK_ROWS, prefetch_pages=1, home_row="old_punjabi"),
+    Category("trending_punjabi", "movie", "movies/punjabi/trending", "trending Punjabi movies", "discover/movie",
+             _discover_movies("pa", sort_by="vote_average.desc", **{"primary_release_date.gte": "2018-01-01"}),
+             ttl=3600, mock_rows=TRENDING_PUNJABI_MOCK_ROWS, home_row="trending_punjabi"),
+    Category("tamil", "movie", "movies/tamil", "Tamil movies", "discover/movie",
+             _discover_movies("ta"), ttl=3600, prefetch_pages=1, home_row="tamil"),
+    Category("telugu", "movie", "movies/telugu", "Telugu movies", "discover/movie",
+             _discover_movies("te"), ttl=3600, prefetch_pages=1, home_row="telugu"),
+    Category("korean", "movie", "movies/korean", "Korean movies", "discover/movie",
+             _discover_movies("ko"), ttl=3600, prefetch_pages=1, home_row="korean"),
+    Category("anime", "movie", "movies/anime", "anime movies", "discover/movie",
+             _discover_movies(with_genres="16", with_origin_country="JP"), ttl=3600, home_row="anime"),
+    Category("series", "series", "series/trending", "trending TV series", "trending/tv/week",
+             ttl=900, prefetch_pages=2, home_row="trending"),
+    Category("web_series", "series", "series/web", "popular web series", "discover/tv",
+             {"sort_by": "popularity.desc", "vote_average.gte": 7.0}, ttl=3600, home_row="web"),
+]}
@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Movie, Series
+from services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class DetailsService:
+    """Movie and series details by TMDB id, from the fastest source that has them.
+
+    Lookups go to an in-memory detail cache first, then (optionally) the
+    cached Mongo catalog in one batched query, and finally TMDB for whatever
+    is still missing, fetched concurrently under a concurrency limit.
+    Catalog copies are cached under their own keys, so callers that skip
+    the catalog only ever get full TMDB records.
+    """
+
+    def __init__(self, tmdb_service, database, write_behind):
+        self.tmdb_service = tmdb_service
+        self.database = database
+        self.write_behind = write_behind
+        self.concurrency = int(os.environ.get('DETAILS_TMDB_CONCURRENCY', 8))
+        self._cache = TTLCache(
+            maxsize=int(os.environ.get('DETAILS_CACHE_SIZE', 5000)),
+            default_ttl=float(os.environ.get('DETAILS_CACHE_TTL', 86400))
+        )
+        self.catalog_hits = 0
+        self.tmdb_fetches = 0
+
+    async def get_movie(self, movie_id: int) -> Optional[Movie]:
+        return (await self.get_many("movie", [movie_id], use_catalog=False)).get(movie_id)
+
+    async def get_series(self, series_id: int) -> Optional[Series]:
+        return (await self.get_many("series", [series_id], use_catalog=False)).get(series_id)
+
+    async def get_many(self, kind: str, tmdb_ids: List[int], use_catalog: bool = True) -> Dict[int, Any]:
+        """Details for each id that exists, keyed by id.
+
+        use_catalog=False skips Mongo, whose documents come from list
+        endpoints and lack detail-only fields such as runtime, unless TMDB
+        itself fails.
+        """
+        found: Dict[int, Any] = {}
+        missing: List[int] = []
+        for tmdb_id in dict.fromkeys(tmdb_ids):
+            item = self._cache.get((kind, tmdb_id))
+            if item is None and use_catalog:
+                item = self._cache.get(("catalog", kind, tmdb_id))
+            if item is not None:
+                found[tmdb_id] = item
+            else:
+                missing.append(tmdb_id)
+
+        if missing and use_catalog:
+            found.update(await self._from_catalog(kind, missing, cache=True))
+            missing = [tmdb_id for tmdb_id in missing if tmdb_id not in found]
+
+        if missing:
+            # Only items known to be absent from the catalog are persisted, so
+            # existing documents keep their category rows
+            fetched, failed = await self._fetch_from_tmdb(kind, missing, persist=use_catalog)
+            found.update(fetched)
+            if failed and not use_catalog:
+                # TMDB is degraded: the list-quality catalog copy beats nothing,
+                # but it is not cached as a full detail record
+                found.update(await self._from_catalog(kind, failed, cache=False))
+
+        return found
+
+    async def _from_catalog(self, kind: str, tmdb_ids: List[int], cache: bool) -> Dict[int, Any]:
+        name = "movies" if kind == "movie" else "series"
+        try:
+            catalog = await self.database.get_catalog_by_content_ids(name, [str(tmdb_id) for tmdb_id in tmdb_ids])
+        except Exception as e:
+            logger.error(f"Catalog lookup for {kind} details failed: {str(e)}")
+            return {}
+
+        found: Dict[int, Any] = {}
+        for tmdb_id in tmdb_ids:
+            item = catalog.get(str(tmdb_id))
+            if item is not None:
+                found[tmdb_id] = item
+                self.catalog_hits += 1
+                if cache:
+                    # Kept apart from full TMDB records so detail lookups never see it
+                    self._cache.set(("catalog", kind, tmdb_id), item)
+        return found
+
+    async def _fetch_from_tmdb(self, kind: str, tmdb_ids: List[int], persist: bool) -> Tuple[Dict[int, Any], List[int]]:
+        """Fetched items keyed by id, plus the ids whose fetch failed upstream"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        fetch = self.tmdb_service.get_movie_details if kind == "movie" else self.tmdb_service.get_series_details
+
+        async def fetch_one(tmdb_id: int):
+            async with semaphore:
+                return await fetch(tmdb_id)
+
+        results = await asyncio.gather(*(fetch_one(tmdb_id) for tmdb_id in tmdb_ids), return_exceptions=True)
+
+        fetched: Dict[int, Any] = {}
+        failed: List[int] = []
+        for tmdb_id, item in zip(tmdb_ids, results):
+            if isinstance(item, Exception):
+                logger.error(f"Error fetching {kind} {tmdb_id} details: {str(item)}")
+                failed.append(tmdb_id)
+                continue
+            if item is None:
+                continue
+            self.tmdb_fetches += 1
+            fetched[tmdb_id] = item
+            self._cache.set((kind, tmdb_id), item)
+
+        if persist and fetched:
+            # Stored for future catalog lookups without joining a category row
+            uncategorized = [item.model_copy(update={"categories": []}) for item in fetched.values()]
+            if kind == "movie":
+                self.write_behind.enqueue_movies(uncategorized)
+            else:
+                self.write_behind.enqueue_series(uncategorized)
+        return fetched, failed
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._cache.get_stats()
+        stats["catalog_hits"] = self.catalog_hits
+        stats["tmdb_fetches"] = self.tmdb_fetches
+        return stats
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Unsalted SHA-256 hex digests written before the KDF migration
+_LEGACY_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash operations are already queued"""
+
+
+class PasswordService:
+    """scrypt password hashing executed in a dedicated thread pool.
+
+    hashlib.scrypt releases the GIL, so hashing in worker threads keeps the
+    event loop responsive during login bursts. Work beyond ``max_pending``
+    queued operations is rejected with PasswordHasherBusy instead of piling up.
+    Hashes are stored as ``scrypt$n$r$p$salt$hash`` (base64 salt and hash).
+    """
+
+    def __init__(self):
+        self.n = int(os.environ.get('PASSWORD_SCRYPT_N', 2 ** 14))
+        self.r = int(os.environ.get('PASSWORD_SCRYPT_R', 8))
+        self.p = int(os.environ.get('PASSWORD_SCRYPT_P', 1))
+        self.salt_bytes = 16
+        self.key_bytes = 32
+        self.workers = int(os.environ.get('PASSWORD_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+        self.max_pending = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 64))
+
+        # Never matches; verified for unknown accounts so they cost as much as known ones
+        self._dummy_hash = "$".join([
+            "scrypt", str(self.n), str(self.r), str(self.p),
+            base64.b64encode(bytes(self.salt_bytes)).decode(), base64.b64encode(bytes(self.key_bytes)).decode()
+        ])
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.operations = 0
+        self.rejected = 0
+        self.legacy_verifications = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # KDF
+    @staticmethod
+    def _scrypt(password: str, salt: bytes, n: int, r: int, p: int, key_bytes: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p,
+            maxmem=256 * n * r * p, dklen=key_bytes
+        )
+
+    async def _run(self, *args) -> bytes:
+        """Run one scrypt computation in the pool, tracking queue depth and latency"""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._scrypt, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - started
+            self.operations += 1
+            self.total_latency += elapsed
+            self.max_latency = max(self.max_latency, elapsed)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current cost parameters"""
+        salt = os.urandom(self.salt_bytes)
+        key = await self._run(password, salt, self.n, self.r, self.p, self.key_bytes)
+        return "$".join([
+            "scrypt", str(self.n), str(self.r), str(self.p),
+            base64.b64encode(salt).decode(), base64.b64encode(key).decode()
+        ])
+
+    async def verify(self, password: str, stored_hash: str) -> bool:
+        """Verify a password against an scrypt or legacy SHA-256 hash"""
+        if _LEGACY_SHA256_RE.match(stored_hash or ""):
+            self.legacy_verifications += 1
+            legacy = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy, stored_hash)
+
+        try:
+            scheme, n, r, p, salt, key = stored_hash.split("$")
+            if scheme != "scrypt":
+                return False
+            expected = base64.b64decode(key)
+            candidate = await self._run(password, base64.b64decode(salt), int(n), int(r), int(p), len(expected))
+        except (ValueError, TypeError) as e:
+            logger.error(f"Malformed password hash: {str(e)}")
+            return False
+
+        return hmac.compare_digest(candidate, expected)
+
+    async def verify_dummy(self, password: str) -> bool:
+        """Spend one verification's worth of work on an account that does not exist"""
+        await self.verify(password, self._dummy_hash)
+        return False
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """True for legacy hashes or hashes made with different cost parameters"""
+        parts = (stored_hash or "").split("$")
+        return len(parts) != 6 or parts[0] != "scrypt" or parts[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "scrypt": {"n": self.n, "r": self.r, "p": self.p},
+            "workers": self.workers,
+            "queue_depth": self._pending,
+            "max_pending": self.max_pending,
+            "operations": self.operations,
+            "rejected": self.rejected,
+            "legacy_verifications": self.legacy_verifications,
+            "avg_latency_ms": round(self.total_latency / self.operations * 1000, 2) if self.operations else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 2)
+        }
@@ -0,0 +1,126 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import logging
+import os
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchJob:
+    """One catalog row refreshed on its own schedule"""
+
+    def __init__(self, name: str, fetcher: Callable[[int], Awaitable[List[Any]]], kind: str, interval: float,
+                 pages: int):
+        self.name = name
+        self.fetcher = fetcher
+        self.kind = kind
+        self.interval = interval
+        self.pages = pages
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refreshed: Optional[float] = None
+        self.next_run: Optional[float] = None
+
+
+class PrefetchService:
+    """Keep catalog rows warm so requests are answered from cache.
+
+    Each job refreshes the first ``pages`` pages of one TMDB category a
+    little before its cache entry would expire, writing through to the
+    response cache and (via write-behind) to Mongo. Jobs start staggered and
+    every interval is jittered, so refreshes are spread out instead of
+    arriving at TMDB together.
+    """
+
+    def __init__(self, tmdb_service, write_behind):
+        self.tmdb_service = tmdb_service
+        self.write_behind = write_behind
+        self.enabled = os.environ.get('PREFETCH_ENABLED', 'true').lower() == 'true'
+        self.pages = int(os.environ.get('PREFETCH_PAGES', 2))
+        self.stagger = float(os.environ.get('PREFETCH_STAGGER', 1.0))
+        self.refresh_fraction = float(os.environ.get('PREFETCH_REFRESH_FRACTION', 0.8))
+        self.jitter = float(os.environ.get('PREFETCH_JITTER', 0.1))
+        self.retry_delay = float(os.environ.get('PREFETCH_RETRY_DELAY', 60))
+
+        self.jobs: List[PrefetchJob] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, name: str, fetcher: Callable[[int], Awaitable[List[Any]]], kind: str, ttl: float,
+                pages: Optional[int] = None):
+        """Register a row fetcher whose cached responses live for ttl seconds.
+
+        ``pages`` overrides PREFETCH_PAGES for this row.
+        """
+        pages = self.pages if pages is None else pages
+        if pages > 0:
+            self.jobs.append(PrefetchJob(name, fetcher, kind, ttl * self.refresh_fraction, pages))
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def start(self):
+        if not self.enabled or self._tasks:
+            return
+        for position, job in enumerate(self.jobs):
+            delay = position * self.stagger + random.uniform(0, self.stagger)
+            self._tasks.append(asyncio.create_task(self._run(job, delay)))
+        logger.info(f"Prefetcher started for {len(self.jobs)} rows")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, job: PrefetchJob, delay: float):
+        while True:
+            job.next_run = time.time() + delay
+            await asyncio.sleep(delay)
+            delay = self._jittered(job.interval if await self.refresh(job) else min(job.interval, self.retry_delay))
+
+    async def refresh(self, job: PrefetchJob) -> bool:
+        """Refetch every prefetched page of a row; True when all pages succeeded"""
+        ok = True
+        for page in range(1, job.pages + 1):
+            try:
+                with self.tmdb_service.bypass_cache():
+                    items = await job.fetcher(page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                job.failures += 1
+                logger.warning(f"Prefetch of {job.name} page {page} failed: {str(e)}")
+                ok = False
+                break
+
+            if items:
+                if job.kind == "movie":
+                    self.write_behind.enqueue_movies(items)
+                else:
+                    self.write_behind.enqueue_series(items)
+
+        if ok:
+            job.refreshes += 1
+            job.last_refreshed = time.time()
+        return ok
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "enabled": self.enabled,
+            "running": len(self._tasks),
+            "pages": self.pages,
+            "jobs": {
+                job.name: {
+                    "interval_s": round(job.interval),
+                    "pages": job.pages,
+                    "refreshes": job.refreshes,
+                    "failures": job.failures,
+                    "age_s": round(now - job.last_refreshed) if job.last_refreshed else None,
+                    "next_run_in_s": round(max(0.0, job.next_run - now), 1) if job.next_run else None
+                }
+                for job in self.jobs
+            }
+        }
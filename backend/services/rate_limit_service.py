@@ -0,0 +1,230 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import ipaddress
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a key has no tokens left; carries the seconds until the next one"""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for {scope}")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+def _refill(state: Optional[Tuple[float, float]], capacity: float, rate: float, now: float) -> float:
+    """Tokens available now for a bucket last stored as (tokens, timestamp)"""
+    if state is None:
+        return capacity
+    tokens, updated = state
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+class MemoryRateLimitBackend:
+    """Token buckets held in process memory.
+
+    Each active key costs one (tokens, timestamp) pair. Keys are kept in
+    least-recently-used order, so idle keys are evicted from the front in
+    amortized O(1) as new requests arrive.
+    """
+
+    def __init__(self, idle_ttl: float = 3600, max_keys: int = 100000):
+        self.idle_ttl = idle_ttl
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def take(self, key: str, capacity: float, rate: float, cost: float = 1) -> float:
+        now = time.monotonic()
+        self._evict(now)
+
+        tokens = _refill(self._buckets.get(key), capacity, rate, now)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        return 0.0 if allowed else (cost - tokens) / rate
+
+    def _evict(self, now: float):
+        while self._buckets:
+            key, (_, updated) = next(iter(self._buckets.items()))
+            if now - updated < self.idle_ttl and len(self._buckets) < self.max_keys:
+                break
+            del self._buckets[key]
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "keys": len(self._buckets), "evictions": self.evictions}
+
+
+class LocalSharedStore:
+    """In-process stand-in for a shared key-value store (e.g. Redis).
+
+    Provides the same get / compare-and-set / expiry contract a networked
+    store would, so the shared backend can be exercised in one process.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Any, float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl: float) -> bool:
+        async with self._lock:
+            if await self.get(key) != expected:
+                return False
+            self._data[key] = (value, time.time() + ttl)
+            # Opportunistically drop expired keys
+            if len(self._data) % 1024 == 0:
+                now = time.time()
+                for stale in [k for k, (_, expires) in self._data.items() if expires <= now]:
+                    del self._data[stale]
+            return True
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SharedRateLimitBackend:
+    """Token buckets kept in a shared store so all workers see the same limits.
+
+    Buckets are updated with optimistic compare-and-set and expire from the
+    store once they have been idle for ``idle_ttl`` seconds.
+    """
+
+    def __init__(self, store=None, idle_ttl: float = 3600, max_retries: int = 5):
+        self.store = store or LocalSharedStore()
+        self.idle_ttl = idle_ttl
+        self.max_retries = max_retries
+        self.conflicts = 0
+
+    async def take(self, key: str, capacity: float, rate: float, cost: float = 1) -> float:
+        for _ in range(self.max_retries):
+            now = time.time()
+            state = await self.store.get(key)
+            tokens = _refill(state, capacity, rate, now)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            if await self.store.compare_and_set(key, state, (tokens, now), self.idle_ttl):
+                return 0.0 if allowed else (cost - tokens) / rate
+            self.conflicts += 1
+
+        # Heavy contention on one key is itself a sign of abuse
+        return 1.0 / rate
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "shared", "keys": len(self.store), "conflicts": self.conflicts}
+
+
+def _parse_networks(value: str) -> List[Any]:
+    """Comma-separated IPs/CIDRs, e.g. "10.0.0.0/8,127.0.0.1" """
+    networks = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(part, strict=False))
+        except ValueError:
+            logger.warning(f"Ignoring invalid trusted proxy {part!r}")
+    return networks
+
+
+def _forwarded_hops(forwarded: Optional[str], forwarded_for: Optional[str]) -> List[str]:
+    """Client chain from Forwarded (RFC 7239) or X-Forwarded-For, nearest hop last"""
+    hops = []
+    if forwarded:
+        for element in forwarded.split(","):
+            for pair in element.split(";"):
+                name, _, value = pair.strip().partition("=")
+                if name.lower() == "for":
+                    value = value.strip('"')
+                    if value.startswith("["):
+                        value = value[1:value.find("]")] if "]" in value else value[1:]
+                    elif value.count(":") == 1:
+                        value = value.split(":")[0]
+                    hops.append(value)
+    elif forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    return hops
+
+
+class RateLimitService:
+    """Named token-bucket limits (capacity and refill rate per second) over a pluggable backend"""
+
+    def __init__(self, backend=None):
+        if backend is None:
+            idle_ttl = float(os.environ.get('RATE_LIMIT_IDLE_TTL', 3600))
+            if os.environ.get('RATE_LIMIT_BACKEND', 'memory') == 'shared':
+                backend = SharedRateLimitBackend(idle_ttl=idle_ttl)
+            else:
+                backend = MemoryRateLimitBackend(idle_ttl=idle_ttl)
+        self.backend = backend
+
+        self.limits: Dict[str, Tuple[float, float]] = {
+            "login_ip": (float(os.environ.get('RATE_LIMIT_LOGIN_IP_BURST', 20)), 20 / 60),
+            "login_email": (float(os.environ.get('RATE_LIMIT_LOGIN_EMAIL_BURST', 5)), 5 / 300),
+            "register_ip": (float(os.environ.get('RATE_LIMIT_REGISTER_IP_BURST', 5)), 5 / 3600)
+        }
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {scope: 0 for scope in self.limits}
+
+        # Reverse proxies whose forwarding headers are believed; without any,
+        # per-IP limits behind a proxy would key every user on the proxy
+        self.trusted_proxies = _parse_networks(os.environ.get('RATE_LIMIT_TRUSTED_PROXIES', ''))
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, peer: Optional[str], forwarded: Optional[str] = None, forwarded_for: Optional[str] = None) -> str:
+        """Address to key per-IP limits on.
+
+        Forwarding headers are used only when the direct peer is a trusted
+        proxy. The chain is walked from the nearest hop and the first
+        untrusted address is the client, so clients cannot spoof it by
+        prepending entries.
+        """
+        if not peer:
+            return "unknown"
+        if not self._is_trusted(peer):
+            return peer
+
+        hops = _forwarded_hops(forwarded, forwarded_for)
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops else peer
+
+    async def hit(self, scope: str, key: str):
+        """Consume one token for key under scope, raising RateLimitExceeded when empty"""
+        capacity, rate = self.limits[scope]
+        retry_after = await self.backend.take(f"{scope}:{key}", capacity, rate)
+        if retry_after > 0:
+            self.rejected[scope] += 1
+            raise RateLimitExceeded(scope, math.ceil(retry_after))
+        self.allowed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.backend.get_stats()
+        stats["allowed"] = self.allowed
+        stats["rejected"] = dict(self.rejected)
+        stats["trusted_proxies"] = len(self.trusted_proxies)
+        return stats
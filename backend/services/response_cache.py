@@ -0,0 +1,296 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import gzip
+import hashlib
+import logging
+import os
+import time
+
+from starlette.datastructures import Headers
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 512
+
+
+class CachedResponse:
+    """One rendered response plus its compressed variants, built on demand"""
+    __slots__ = ("key", "content_type", "body", "digest", "cache_control", "expires_at", "size", "variants")
+
+    def __init__(self, key: Tuple[str, bytes], content_type: bytes, body: bytes, max_age: int):
+        self.key = key
+        self.content_type = content_type
+        self.body = body
+        self.digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.cache_control = f"public, max-age={max_age}".encode()
+        self.expires_at = time.monotonic() + max_age
+        # Bytes held by every variant, the identity body included
+        self.size = len(body)
+        self.variants: Dict[str, Tuple[bytes, bytes]] = {"identity": (body, f'"{self.digest}"'.encode())}
+
+    def variant(self, encoding: str) -> Tuple[bytes, bytes]:
+        """(body, strong ETag) for an encoding, compressing on first use"""
+        cached = self.variants.get(encoding)
+        if cached is not None:
+            return cached
+        if encoding == "br":
+            body = brotli.compress(self.body, quality=5)
+        else:
+            body = gzip.compress(self.body, compresslevel=6, mtime=0)
+        cached = self.variants[encoding] = (body, f'"{self.digest}-{encoding}"'.encode())
+        self.size += len(body)
+        return cached
+
+
+class ResponseCache:
+    """Rendered, compressed catalog responses for anonymous GET requests.
+
+    Entries are keyed by path and query string and hold the serialized body
+    once; gzip/brotli variants are compressed the first time a client asks
+    for them. Each variant has its own strong ETag, so revalidation with
+    If-None-Match is answered with 304 without running the route.
+
+    The cache is bounded by the bytes of every stored variant (and by entry
+    count), evicting least recently used entries first.
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.max_bytes = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+        self.max_body_bytes = min(int(os.environ.get('RESPONSE_CACHE_MAX_BODY', 2 * 1024 * 1024)), self.max_bytes)
+        self.maxsize = int(os.environ.get('RESPONSE_CACHE_SIZE', 1024))
+        # Path prefix -> seconds an entry (and the client's copy) stays fresh
+        self.ttls: Dict[str, int] = {
+            "/api/home": int(os.environ.get('RESPONSE_CACHE_TTL', 60)),
+            "/api/movies/": int(os.environ.get('RESPONSE_CACHE_TTL', 60)),
+            "/api/series/": int(os.environ.get('RESPONSE_CACHE_TTL', 60)),
+            "/api/categories": int(os.environ.get('RESPONSE_CACHE_TTL', 60)),
+            "/api/categories/": int(os.environ.get('RESPONSE_CACHE_TTL', 60)),
+            "/api/sports/": int(os.environ.get('RESPONSE_CACHE_SPORTS_TTL', 15))
+        }
+        self._entries: "OrderedDict[Tuple[str, bytes], CachedResponse]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.not_modified = 0
+        self.bypassed = 0
+        self.bytes_served = 0
+        self.bytes_uncompressed = 0
+
+    def ttl_for(self, scope: Dict[str, Any]) -> Optional[int]:
+        """Freshness lifetime for a cacheable request, None when it must not be cached"""
+        if not self.enabled or scope["method"] != "GET":
+            return None
+        path = scope["path"]
+        for prefix, ttl in self.ttls.items():
+            if path == prefix or (prefix.endswith("/") and path.startswith(prefix)):
+                return ttl
+        return None
+
+    @staticmethod
+    def negotiate(accept_encoding: str) -> str:
+        accepted = set()
+        for part in accept_encoding.split(","):
+            coding, _, params = part.partition(";")
+            name, _, quality = params.strip().partition("=")
+            try:
+                if name.strip() == "q" and float(quality) == 0:
+                    continue
+            except ValueError:
+                continue
+            accepted.add(coding.strip().lower())
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return "identity"
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(entry)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(self, key: Tuple[str, bytes], content_type: bytes, body: bytes, ttl: int) -> CachedResponse:
+        entry = CachedResponse(key, content_type, body, ttl)
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._remove(previous)
+        self._entries[key] = entry
+        self.total_bytes += entry.size
+        self._evict()
+        return entry
+
+    def variant(self, entry: CachedResponse, encoding: str) -> Tuple[bytes, bytes]:
+        """An entry's variant for an encoding; newly compressed bytes count toward the limit"""
+        before = entry.size
+        result = entry.variant(encoding)
+        if entry.size != before and self._entries.get(entry.key) is entry:
+            self.total_bytes += entry.size - before
+            self._evict()
+        return result
+
+    def _remove(self, entry: CachedResponse):
+        del self._entries[entry.key]
+        self.total_bytes -= entry.size
+
+    def _evict(self):
+        while self._entries and (self.total_bytes > self.max_bytes or len(self._entries) > self.maxsize):
+            _, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "brotli": brotli is not None,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "bypassed": self.bypassed,
+            "bytes_served": self.bytes_served,
+            "bytes_uncompressed": self.bytes_uncompressed
+        }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: bytes, base_etag: bytes) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag.encode() in (etag, base_etag):
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    """Pure ASGI middleware serving catalog GETs from a ResponseCache.
+
+    Authenticated requests, non-JSON or non-200 responses and bodies
+    larger than the cache limit are passed through untouched, so streaming
+    responses keep streaming.
+    """
+
+    def __init__(self, app, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        ttl = self.cache.ttl_for(scope)
+        if ttl is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if "authorization" in headers:
+            self.cache.bypassed += 1
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["path"], scope["query_string"])
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = await self._render(scope, receive, send, key, ttl)
+            if entry is None:
+                return
+
+        encoding = self.cache.negotiate(headers.get("accept-encoding", ""))
+        if encoding != "identity" and len(entry.body) < MIN_COMPRESS_BYTES:
+            encoding = "identity"
+        body, etag = self.cache.variant(entry, encoding)
+
+        response_headers: List[Tuple[bytes, bytes]] = [
+            (b"etag", etag),
+            (b"cache-control", entry.cache_control),
+            (b"vary", b"Accept-Encoding")
+        ]
+        if _etag_matches(headers.get("if-none-match"), etag, entry.variants["identity"][1]):
+            self.cache.not_modified += 1
+            await send({"type": "http.response.start", "status": 304, "headers": response_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        response_headers.append((b"content-type", entry.content_type))
+        response_headers.append((b"content-length", str(len(body)).encode()))
+        if encoding != "identity":
+            response_headers.append((b"content-encoding", encoding.encode()))
+        self.cache.bytes_served += len(body)
+        self.cache.bytes_uncompressed += len(entry.body)
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _render(self, scope, receive, send, key, ttl: int) -> Optional[CachedResponse]:
+        """Run the route and capture a cacheable response, or stream it through"""
+        start: Optional[Dict[str, Any]] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def capture(message):
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                response_headers = Headers(raw=message.get("headers", []))
+                content_type = response_headers.get("content-type", "")
+                if (message["status"] != 200 or not content_type.startswith("application/json")
+                        or "content-encoding" in response_headers or "set-cookie" in response_headers):
+                    passthrough = True
+                    await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if message.get("more_body", False) and size > self.cache.max_body_bytes:
+                # Too large to cache: release what was buffered and stream the rest
+                passthrough = True
+                await send(start)
+                await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": True})
+
+        await self.app(scope, receive, capture)
+        if passthrough or start is None:
+            return None
+
+        body = b"".join(chunks)
+        if len(body) > self.cache.max_body_bytes:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return None
+
+        content_type = Headers(raw=start.get("headers", [])).get("content-type", "application/json").encode()
+        if body == b"[]":
+            # Empty rows usually mean a degraded upstream; do not pin them
+            return CachedResponse(key, content_type, body, ttl)
+        return self.cache.store(key, content_type, body, ttl)
@@ -0,0 +1,219 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+import math
+import re
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import ValidationError
+
+from models import Movie, Series
+from services.text_normalizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Spelling variants common in romanized Hindi/Punjabi titles, applied in order
+# ("Sholay"/"Sholey", "Dilwale"/"Dilwaale", "Dulhania"/"Dulhaniya", "Phir"/"Fir")
+_TRANSLITERATION_RULES: List[Tuple[str, str]] = [
+    ("ph", "f"), ("bh", "b"), ("kh", "k"), ("gh", "g"), ("jh", "j"),
+    ("th", "t"), ("dh", "d"), ("sh", "s"), ("ch", "c"), ("ck", "k"),
+    ("aa", "a"), ("ee", "i"), ("oo", "u"), ("ou", "u"),
+    ("ay", "e"), ("ey", "e"), ("ai", "e"),
+    ("w", "v"), ("z", "j"), ("q", "k"), ("y", "i")
+]
+_REPEATED_RE = re.compile(r"(.)\1+")
+
+# Ranking weights: text match dominates, popularity and rating break ties
+POPULARITY_WEIGHT = 0.05
+RATING_WEIGHT = 0.02
+# Minimum trigram similarity for a fuzzy token match
+FUZZY_THRESHOLD = 0.4
+# Score given to a vocabulary token that starts with the (partial) query token
+PREFIX_MATCH_SCORE = 0.9
+
+
+def phonetic_key(token: str) -> str:
+    """Collapse transliteration variants of a normalized token to one key"""
+    for source, target in _TRANSLITERATION_RULES:
+        token = token.replace(source, target)
+    return _REPEATED_RE.sub(r"\1", token)
+
+
+def trigrams(key: str, prefix: bool = False) -> Set[str]:
+    """Padded character trigrams; prefix=True omits the end padding"""
+    padded = f"  {key}" if prefix else f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndexService:
+    """In-process search over the cached movie/series catalog.
+
+    Titles are tokenized and reduced to transliteration-insensitive keys held
+    in an inverted index (key -> documents). A second index maps character
+    trigrams to vocabulary keys so misspelled or partial query tokens can be
+    matched fuzzily without scanning the vocabulary.
+    """
+
+    def __init__(self):
+        # Document slots: (kind, model, keys); a replaced title keeps its slot
+        self._docs: List[Optional[Tuple[str, Any, Tuple[str, ...]]]] = []
+        self._slots: Dict[Tuple[str, Any], int] = {}
+        self._key_docs: Dict[str, Set[int]] = defaultdict(set)
+        self._trigram_keys: Dict[str, Set[str]] = defaultdict(set)
+        self.loaded = False
+        self.invalid_documents = 0
+        self.queries = 0
+        self.total_query_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # Index maintenance
+    async def load(self, database):
+        """Build the index from the movies and series collections.
+        
+        Documents that no longer validate are skipped and counted; only a
+        failing scan leaves the index unloaded.
+        """
+        count = 0
+        for name, kind, model in (("movies", "movie", Movie), ("series", "series", Series)):
+            try:
+                async for doc in database.iter_catalog(name):
+                    try:
+                        item = model(**doc)
+                    except ValidationError as e:
+                        self.invalid_documents += 1
+                        logger.warning(f"Search index skipped invalid {kind} {doc.get('tmdb_id') or doc.get('id')}: {str(e)}")
+                        continue
+                    self.add(kind, item)
+                    count += 1
+            except Exception as e:
+                logger.error(f"Search index load failed after {count} titles: {str(e)}")
+                return
+
+        self.loaded = True
+        logger.info(f"Search index loaded {count} titles ({self.invalid_documents} invalid skipped)")
+
+    def on_catalog_saved(self, name: str, items: List[Any]):
+        """Database save listener keeping the index in sync with persisted items"""
+        kind = "movie" if name == "movies" else "series"
+        for item in items:
+            self.add(kind, item)
+
+    def add(self, kind: str, item: Any):
+        """Insert or replace one title"""
+        doc_key = (kind, item.tmdb_id or item.id)
+        slot = self._slots.get(doc_key)
+        if slot is not None:
+            self._unlink(slot)
+        else:
+            slot = len(self._docs)
+            self._docs.append(None)
+
+        keys = tuple(dict.fromkeys(phonetic_key(token) for token in tokenize(item.title)))
+        self._docs[slot] = (kind, item, keys)
+        self._slots[doc_key] = slot
+        for key in keys:
+            if key not in self._key_docs:
+                for gram in trigrams(key):
+                    self._trigram_keys[gram].add(key)
+            self._key_docs[key].add(slot)
+
+    def _unlink(self, slot: int):
+        _, _, keys = self._docs[slot]
+        for key in keys:
+            postings = self._key_docs.get(key)
+            if postings is None:
+                continue
+            postings.discard(slot)
+            if not postings:
+                del self._key_docs[key]
+                for gram in trigrams(key):
+                    vocabulary = self._trigram_keys.get(gram)
+                    if vocabulary is not None:
+                        vocabulary.discard(key)
+                        if not vocabulary:
+                            del self._trigram_keys[gram]
+
+    # Querying
+    def _match_key(self, key: str, prefix: bool) -> Dict[str, float]:
+        """Vocabulary keys similar to key, with their similarity score"""
+        matches: Dict[str, float] = {}
+        if key in self._key_docs:
+            matches[key] = 1.0
+
+        grams = trigrams(key, prefix=prefix)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_keys.get(gram, ()):
+                shared[candidate] += 1
+
+        for candidate, count in shared.items():
+            if candidate in matches:
+                continue
+            if prefix and candidate.startswith(key):
+                matches[candidate] = PREFIX_MATCH_SCORE
+                continue
+            similarity = count / (len(grams) + len(trigrams(candidate)) - count)
+            if similarity >= FUZZY_THRESHOLD:
+                matches[candidate] = similarity
+
+        return matches
+
+    def search(self, query: str, limit: int = 20, prefix: bool = False,
+               kind: Optional[str] = None) -> Tuple[List[Movie], List[Series]]:
+        """Ranked movies and series matching query; prefix=True treats the last word as partial"""
+        started = time.perf_counter()
+        keys = [phonetic_key(token) for token in tokenize(query)]
+        if not keys:
+            return [], []
+
+        # Each query key contributes its best match per document
+        scores: Dict[int, float] = defaultdict(float)
+        for position, key in enumerate(keys):
+            is_partial = prefix and position == len(keys) - 1
+            best: Dict[int, float] = {}
+            for matched_key, similarity in self._match_key(key, is_partial).items():
+                for slot in self._key_docs[matched_key]:
+                    if similarity > best.get(slot, 0.0):
+                        best[slot] = similarity
+            for slot, similarity in best.items():
+                scores[slot] += similarity
+
+        ranked = []
+        for slot, text_score in scores.items():
+            doc_kind, item, doc_keys = self._docs[slot]
+            if kind and doc_kind != kind:
+                continue
+            relevance = text_score / max(len(keys), len(doc_keys))
+            popularity = getattr(item, "popularity", None) or 0.0
+            score = relevance * (1 + POPULARITY_WEIGHT * math.log1p(popularity)) + RATING_WEIGHT * (item.rating or 0.0) * relevance
+            ranked.append((score, doc_kind, item))
+
+        ranked.sort(key=lambda entry: entry[0], reverse=True)
+        movies: List[Movie] = []
+        series_list: List[Series] = []
+        for _, doc_kind, item in ranked:
+            target = movies if doc_kind == "movie" else series_list
+            if len(target) < limit:
+                target.append(item)
+            if len(movies) >= limit and len(series_list) >= limit:
+                break
+
+        self.queries += 1
+        self.total_query_time += time.perf_counter() - started
+        return movies, series_list
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "documents": len(self._slots),
+            "invalid_documents": self.invalid_documents,
+            "vocabulary": len(self._key_docs),
+            "trigrams": len(self._trigram_keys),
+            "queries": self.queries,
+            "avg_query_us": round(self.total_query_time / self.queries * 1e6, 1) if self.queries else 0.0
+        }
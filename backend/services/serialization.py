@@ -0,0 +1,36 @@
+from typing import Any, Dict
+import os
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+# High-throughput mode: orjson rendering, pre-serialized payloads for hot
+# routes and no re-validation of objects the API built itself
+FAST_SERIALIZATION = os.environ.get('FAST_SERIALIZATION', 'true').lower() == 'true'
+
+DefaultResponse = ORJSONResponse if FAST_SERIALIZATION else JSONResponse
+
+
+class JSONBytesResponse(Response):
+    """Response whose body is already-serialized JSON"""
+    media_type = "application/json"
+
+
+def _default(value: Any) -> Dict[str, Any]:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(value: Any) -> bytes:
+    """Serialize models (or lists/dicts of them) straight to JSON bytes"""
+    return orjson.dumps(value, default=_default)
+
+
+def json_response(value: Any) -> Any:
+    """Render a trusted value without response_model re-validation in fast mode"""
+    if not FAST_SERIALIZATION:
+        return value
+    return JSONBytesResponse(dump_json(value))
+
@@ -0,0 +1,182 @@
+import asyncio
+from itertools import chain, zip_longest
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Movie, Series, Suggestion
+from services.cache import TTLCache
+from services.search_index_service import phonetic_key
+from services.text_normalizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+# TMDB returns 20 results per search page; fewer means the result set is complete
+TMDB_PAGE_SIZE = 20
+
+
+class PrefixResults:
+    """Upstream search results cached for one normalized prefix.
+
+    ``movies``/``series`` are TMDB's results as returned, kept for reuse by
+    longer queries; ``matches`` is what the prefix itself answered with.
+    """
+    __slots__ = ("movies", "series", "matches", "complete")
+
+    def __init__(self, movies: List[Movie], series: List[Series], matches: Tuple[List[Movie], List[Series]]):
+        self.movies = movies
+        self.series = series
+        self.matches = matches
+        self.complete = len(movies) < TMDB_PAGE_SIZE and len(series) < TMDB_PAGE_SIZE
+
+
+def _matches(title: str, query_tokens: List[str], query_keys: List[str]) -> bool:
+    """Complete query words must appear in the title, the last word as a prefix.
+
+    Words are compared by phonetic key as well, so transliteration variants
+    ("sholey" / "Sholay") match each other.
+    """
+    title_tokens = tokenize(title)
+    title_keys = [phonetic_key(token) for token in title_tokens]
+    *complete, partial = query_tokens
+    *complete_keys, partial_key = query_keys
+    return all(
+        token in title_tokens or key in title_keys for token, key in zip(complete, complete_keys)
+    ) and any(
+        token.startswith(partial) or key.startswith(partial_key) for token, key in zip(title_tokens, title_keys)
+    )
+
+
+def _filter(movies: List[Movie], series_list: List[Series], query_tokens: List[str]) -> Tuple[List[Movie], List[Series]]:
+    query_keys = [phonetic_key(token) for token in query_tokens]
+    return (
+        [m for m in movies if _matches(m.title, query_tokens, query_keys)],
+        [s for s in series_list if _matches(s.title, query_tokens, query_keys)]
+    )
+
+
+class SuggestService:
+    """Type-ahead suggestions that keep TMDB traffic independent of keystrokes.
+
+    Upstream results are cached per normalized prefix. A longer query reuses
+    the results of the longest cached prefix by filtering them locally
+    ("shol" answers "shola"), so TMDB is only queried for prefixes that have
+    not been seen recently. Local titles come from the in-memory catalog
+    index, or from MongoDB's ``search_tokens`` prefix query until the index
+    has finished loading.
+    """
+
+    def __init__(self, tmdb_service, search_index, database):
+        self.tmdb_service = tmdb_service
+        self.search_index = search_index
+        self.database = database
+        self.min_upstream_length = int(os.environ.get('SUGGEST_MIN_UPSTREAM_LENGTH', 3))
+        self._prefixes = TTLCache(
+            maxsize=int(os.environ.get('SUGGEST_CACHE_SIZE', 5000)),
+            default_ttl=float(os.environ.get('SUGGEST_CACHE_TTL', 600))
+        )
+        self.upstream_fetches = 0
+        self.prefix_reuses = 0
+        self.database_fallbacks = 0
+
+    def _cached_prefix(self, normalized: str, query_tokens: List[str]) -> Optional[Tuple[List[Movie], List[Series]]]:
+        """Answer from the cache: the query's own entry, else the longest cached prefix filtered down"""
+        entry: Optional[PrefixResults] = self._prefixes.get(normalized)
+        if entry is not None:
+            return entry.matches
+
+        for end in range(len(normalized) - 1, self.min_upstream_length - 1, -1):
+            entry = self._prefixes.get(normalized[:end])
+            if entry is None:
+                continue
+
+            movies, series_list = _filter(entry.movies, entry.series, query_tokens)
+            # A complete prefix result set is authoritative
+            if entry.complete or movies or series_list:
+                self.prefix_reuses += 1
+                return movies, series_list
+        return None
+
+    async def _upstream(self, query: str, normalized: str, query_tokens: List[str]) -> Tuple[List[Movie], List[Series]]:
+        if len(normalized) < self.min_upstream_length:
+            return [], []
+
+        cached = self._cached_prefix(normalized, query_tokens)
+        if cached is not None:
+            return cached
+
+        try:
+            movies, series_list = await self.tmdb_service.search_content(query)
+        except Exception as e:
+            logger.error(f"Suggest upstream search failed: {str(e)}")
+            return [], []
+
+        self.upstream_fetches += 1
+        # Filtered exactly like a cache hit, so repeating a query never changes its answer
+        matches = _filter(movies, series_list, query_tokens)
+        self._prefixes.set(normalized, PrefixResults(movies, series_list, matches))
+        return matches
+
+    async def _local(self, query: str, limit: int) -> Tuple[List[Movie], List[Series]]:
+        if self.search_index.loaded:
+            return self.search_index.search(query, limit, prefix=True)
+
+        # Index still loading (or failed to load): use the indexed search_tokens prefix query
+        self.database_fallbacks += 1
+        try:
+            return await asyncio.gather(
+                self.database.search_movies(query, limit, prefix=True),
+                self.database.search_series(query, limit, prefix=True)
+            )
+        except Exception as e:
+            logger.error(f"Suggest database fallback failed: {str(e)}")
+            return [], []
+
+    async def suggest(self, query: str, limit: int = 10) -> List[Suggestion]:
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        normalized = " ".join(query_tokens)
+
+        (local_movies, local_series), (movies, series_list) = await asyncio.gather(
+            self._local(query, limit),
+            self._upstream(query, normalized, query_tokens)
+        )
+
+        # Alternate movies and series, upstream results before local ones
+        candidates = chain(
+            zip_longest((("movie", m) for m in movies), (("series", s) for s in series_list)),
+            zip_longest((("movie", m) for m in local_movies), (("series", s) for s in local_series))
+        )
+
+        suggestions: List[Suggestion] = []
+        seen = set()
+        for candidate in chain.from_iterable(candidates):
+            if candidate is None:
+                continue
+            content_type, item = candidate
+            key = (content_type, item.tmdb_id or item.id)
+            if key in seen:
+                continue
+            seen.add(key)
+            suggestions.append(Suggestion(
+                id=item.id,
+                tmdb_id=item.tmdb_id,
+                title=item.title,
+                year=item.year,
+                thumbnail=item.thumbnail,
+                content_type=content_type
+            ))
+            if len(suggestions) >= limit:
+                break
+
+        return suggestions
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._prefixes.get_stats()
+        stats["upstream_fetches"] = self.upstream_fetches
+        stats["prefix_reuses"] = self.prefix_reuses
+        stats["database_fallbacks"] = self.database_fallbacks
+        return stats
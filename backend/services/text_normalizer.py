@@ -0,0 +1,16 @@
+from typing import List
+import re
+import unicodedata
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and strip accents/diacritics"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized alphanumeric tokens, preserving order and dropping repeats"""
+    return list(dict.fromkeys(_TOKEN_RE.findall(normalize(text))))
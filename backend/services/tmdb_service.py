@@ -1,15 +1,27 @@
 import aiohttp
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, List, Dict, Any, Optional
 import logging
+import time
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import Movie, Series
+from services.cache import SingleFlight, TTLCache
+from services.category_registry import CATEGORIES, Category
+from services.upstream_guard import (
+    AsyncTokenBucket, CircuitBreaker, CircuitOpenError, UpstreamError, backoff_delay, parse_retry_after
+)
 
 logger = logging.getLogger(__name__)
 
+# Set while refreshing ahead of expiry: cached list responses are refetched and overwritten
+_bypass_cache: ContextVar[bool] = ContextVar("tmdb_bypass_cache", default=False)
+
 class TMDBService:
     def __init__(self, api_key: str):
         self.api_key = api_key
@@ -17,25 +29,256 @@ class TMDBService:
         self.image_base_url = "https://image.tmdb.org/t/p/w500"
         self.backdrop_base_url = "https://image.tmdb.org/t/p/w1280"
         
-    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request to TMDB API"""
-        if params is None:
-            params = {}
+        # Connection pool settings (shared by every TMDB call)
+        self.pool_limit = int(os.environ.get('TMDB_POOL_LIMIT', 100))
+        self.pool_limit_per_host = int(os.environ.get('TMDB_POOL_LIMIT_PER_HOST', 30))
+        self.keepalive_timeout = float(os.environ.get('TMDB_KEEPALIVE_TIMEOUT', 30))
+        self.dns_cache_ttl = int(os.environ.get('TMDB_DNS_CACHE_TTL', 300))
+        self.request_timeout = float(os.environ.get('TMDB_REQUEST_TIMEOUT', 10))
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._requests_total = 0
+        self._requests_failed = 0
+        self._in_flight = 0
+        self._sessions_created = 0
+        
+        # Response cache for list endpoints (TTL per category, see the registry);
+        # expired entries are served stale for up to `cache_stale_ttl` seconds
+        # while a background refresh runs
+        self.cache_stale_ttl = float(os.environ.get('TMDB_CACHE_STALE_TTL', 3600))
+        self._cache = TTLCache(
+            maxsize=int(os.environ.get('TMDB_CACHE_SIZE', 2048)),
+            stale_ttl=self.cache_stale_ttl
+        )
+        self._refreshing: Dict[tuple, asyncio.Task] = {}
+        self.background_refreshes = 0
+        
+        # Identical concurrent requests share a single upstream call
+        self._flights = SingleFlight()
+        
+        # Upstream protection: every TMDB request passes a global concurrency
+        # limit and a token bucket sized to TMDB's rate limit; 429/5xx are
+        # retried with jittered backoff and repeated failures open the circuit
+        self.max_concurrency = int(os.environ.get('TMDB_MAX_CONCURRENCY', 20))
+        self.max_retries = int(os.environ.get('TMDB_MAX_RETRIES', 3))
+        self.backoff_base = float(os.environ.get('TMDB_BACKOFF_BASE', 0.25))
+        self.backoff_max = float(os.environ.get('TMDB_BACKOFF_MAX', 5))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._bucket = AsyncTokenBucket(
+            capacity=float(os.environ.get('TMDB_RATE_BURST', 40)),
+            rate=float(os.environ.get('TMDB_RATE_PER_SECOND', 40))
+        )
+        self._breaker = CircuitBreaker(
+            "tmdb",
+            failure_threshold=int(os.environ.get('TMDB_BREAKER_FAILURES', 5)),
+            reset_timeout=float(os.environ.get('TMDB_BREAKER_RESET', 30))
+        )
+        self._retries = 0
+        self._throttled = 0
+        
+        self._category_stats: Dict[str, Dict[str, int]] = {
+            name: {"requests": 0, "items": 0, "empty": 0, "mock_fallbacks": 0} for name in CATEGORIES
+        }
+    
+    async def start(self):
+        """Open the shared HTTP session (called from the app startup hook)"""
+        await self._get_session()
+        logger.info("TMDB HTTP session started")
+    
+    async def close(self):
+        """Close the shared HTTP session (called from the app shutdown hook)"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("TMDB HTTP session closed")
+        self._session = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use"""
+        if self._session and not self._session.closed:
+            return self._session
+        
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_limit,
+                    limit_per_host=self.pool_limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    use_dns_cache=True
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+                )
+                self._sessions_created += 1
+        
+        return self._session
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Response cache statistics"""
+        stats = self._cache.get_stats()
+        stats["refreshing"] = len(self._refreshing)
+        stats["background_refreshes"] = self.background_refreshes
+        stats["coalescing"] = self._flights.get_stats()
+        return stats
+    
+    def get_upstream_stats(self) -> Dict[str, Any]:
+        """Concurrency limiter, rate limiter and circuit breaker state"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "available_slots": self._semaphore._value,
+            "rate_limiter": self._bucket.get_stats(),
+            "circuit": self._breaker.get_stats(),
+            "retries": self._retries,
+            "throttled": self._throttled
+        }
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics for the shared session"""
+        connector = self._session.connector if self._session and not self._session.closed else None
+        idle = 0
+        if connector is not None:
+            # aiohttp keeps idle keep-alive connections per (host, port, ssl) key
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        
+        return {
+            "session_open": connector is not None,
+            "sessions_created": self._sessions_created,
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "in_flight": self._in_flight,
+            "idle_connections": idle,
+            "requests_total": self._requests_total,
+            "requests_failed": self._requests_failed
+        }
+        
+    @contextmanager
+    def bypass_cache(self):
+        """Refetch and overwrite cached list responses for calls made in this context"""
+        token = _bypass_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+    
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """Cache key from endpoint and normalized (sorted, stringified) params"""
+        items = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if k != 'api_key'))
+        return (endpoint.strip('/'), items)
+    
+    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Make request to TMDB API, served from the response cache when `ttl` is given"""
+        key = self._cache_key(endpoint, params)
+        if ttl is None:
+            return await self._fetch_coalesced(key, endpoint, params)
+        
+        entry = None if _bypass_cache.get() else self._cache.get_entry(key)
+        if entry is not None:
+            if not entry.is_fresh(time.monotonic()):
+                self._schedule_refresh(key, endpoint, params, ttl)
+            return entry.value
+        
+        data = await self._fetch_coalesced(key, endpoint, params)
+        if data:
+            self._cache.set(key, data, ttl=ttl)
+        return data
+    
+    async def _fetch_coalesced(self, key: tuple, endpoint: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch from TMDB, joining an identical request already in flight"""
+        return await self._flights.do(key, lambda: self._fetch(endpoint, params))
+    
+    def _schedule_refresh(self, key: tuple, endpoint: str, params: Optional[Dict[str, Any]], ttl: float):
+        """Refresh a stale cache entry in the background (at most one task per key)"""
+        if key in self._refreshing:
+            return
+        
+        async def refresh():
+            try:
+                data = await self._fetch_coalesced(key, endpoint, params)
+                if data:
+                    self._cache.set(key, data, ttl=ttl)
+                    self.background_refreshes += 1
+            except UpstreamError as e:
+                # Keep serving the stale copy; the next request retries
+                logger.warning(f"TMDB background refresh of {endpoint} failed: {str(e)}")
+            finally:
+                self._refreshing.pop(key, None)
+        
+        self._refreshing[key] = asyncio.create_task(refresh())
+    
+    async def _fetch(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Make HTTP request to TMDB API with rate limiting, retries and a circuit breaker.
+        
+        Returns {} for unknown ids (404); raises UpstreamError when TMDB is
+        unavailable so callers can fall back to the database.
+        """
+        if not self._breaker.allow():
+            raise CircuitOpenError("TMDB circuit is open")
         
+        params = dict(params or {})
         params['api_key'] = self.api_key
         url = f"{self.base_url}/{endpoint}"
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"TMDB API error: {response.status}")
-                        return {}
-        except Exception as e:
-            logger.error(f"TMDB request failed: {str(e)}")
-            return {}
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            await self._bucket.acquire()
+            
+            async with self._semaphore:
+                self._requests_total += 1
+                self._in_flight += 1
+                try:
+                    session = await self._get_session()
+                    async with session.get(url, params=params) as response:
+                        status = response.status
+                        if status == 200:
+                            data = await response.json()
+                            self._breaker.record_success()
+                            return data
+                        if status == 429:
+                            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    error = f"TMDB API error: {status}"
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    # ValueError: a 200 whose body is not valid JSON (truncated or an HTML error page)
+                    status = None
+                    error = f"TMDB request failed: {e!r}"
+                finally:
+                    self._in_flight -= 1
+            
+            self._requests_failed += 1
+            if status == 404:
+                self._breaker.record_success()
+                return {}
+            if status is not None and status < 500 and status != 429:
+                # Other client errors (bad key, bad params) will not succeed on retry
+                self._breaker.record_success()
+                raise UpstreamError(error, status)
+            
+            if status == 429:
+                self._throttled += 1
+                if retry_after is not None:
+                    # Every request waits out the upstream's cool-down, not just this one
+                    self._bucket.pause(min(retry_after, self.backoff_max))
+            
+            if attempt == self.max_retries:
+                break
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+            if retry_after is not None:
+                if retry_after > self.backoff_max:
+                    break
+                delay = max(delay, retry_after)
+            self._retries += 1
+            logger.warning(f"{error} for {endpoint}; retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        
+        self._breaker.record_failure()
+        logger.error(f"{error} for {endpoint}; giving up")
+        raise UpstreamError(error, status)
     
     def _transform_movie(self, tmdb_movie: Dict[str, Any]) -> Movie:
         """Transform TMDB movie data to our Movie model"""
@@ -97,57 +340,71 @@ class TMDBService:
             episodes=tmdb_series.get('number_of_episodes', 10)
         )
     
-    async def get_trending_movies(self, page: int = 1) -> List[Movie]:
-        """Get trending movies"""
-        data = await self._make_request(f"trending/movie/week", {"page": page})
-        movies = []
+    async def get_category(self, name: str, page: int = 1, mock_fallback: bool = True) -> List[Any]:
+        """Get one page of a registered category as movies or series.
         
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["trending"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_popular_movies(self, page: int = 1) -> List[Movie]:
-        """Get popular movies"""
-        data = await self._make_request(f"movie/popular", {"page": page})
-        movies = []
+        Mock rows stand in for an empty first page only, and only while
+        mock_fallback is set; later pages come back empty so paging ends.
+        """
+        category: Category = CATEGORIES[name]
+        stats = self._category_stats[name]
+        stats["requests"] += 1
         
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["popular"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_trending_series(self, page: int = 1) -> List[Series]:
-        """Get trending TV series"""
-        data = await self._make_request(f"trending/tv/week", {"page": page})
-        series_list = []
+        data = await self._make_request(category.endpoint, {**category.params, "page": page}, ttl=category.ttl)
+        transform = self._transform_movie if category.kind == "movie" else self._transform_series
+        items = []
         
-        for series_data in data.get('results', []):
+        for item_data in data.get('results', []):
             try:
-                series = self._transform_series(series_data)
-                series.categories = ["series"]
-                series_list.append(series)
+                item = transform(item_data)
+                item.categories = [category.name]
+                items.append(item)
             except Exception as e:
-                logger.error(f"Error transforming series: {str(e)}")
+                logger.error(f"Error transforming {category.name} {category.kind}: {str(e)}")
                 continue
+        
+        if not items:
+            stats["empty"] += 1
+            if category.mock_rows and mock_fallback and page == 1:
+                stats["mock_fallbacks"] += 1
+                items = self.mock_items(category)
+        
+        stats["items"] += len(items)
+        return items
+    
+    async def iter_category_pages(self, name: str, pages: int, window: int = 4) -> AsyncIterator[List[Any]]:
+        """Yield pages 1..pages of a category in order, fetching up to `window` ahead.
+        
+        Only the pages inside the window are held at once, however many are
+        requested. Iteration stops at the first empty page; mock rows are
+        never streamed.
+        """
+        pending: Deque[asyncio.Task] = deque()
+        next_page = 1
+        try:
+            while pending or next_page <= pages:
+                while next_page <= pages and len(pending) < window:
+                    pending.append(asyncio.create_task(self.get_category(name, next_page, mock_fallback=False)))
+                    next_page += 1
                 
-        return series_list
+                items = await pending.popleft()
+                if not items:
+                    return
+                yield items
+        finally:
+            for task in pending:
+                task.cancel()
     
-    async def search_content(self, query: str, page: int = 1) -> tuple[List[Movie], List[Series]]:
-        """Search movies and TV shows"""
-        # Search movies
+    def mock_items(self, category: Category) -> List[Any]:
+        """The category's offline rows as movies or series"""
+        model = Movie if category.kind == "movie" else Series
+        return [model(**data, categories=[category.name]) for data in category.mock_rows]
+    
+    def get_category_stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: dict(stats) for name, stats in self._category_stats.items()}
+    
+    async def search_movies(self, query: str, page: int = 1) -> List[Movie]:
+        """Search movies"""
         movies_data = await self._make_request("search/movie", {"query": query, "page": page})
         movies = []
         
@@ -159,7 +416,10 @@ class TMDBService:
                 logger.error(f"Error transforming search movie: {str(e)}")
                 continue
         
-        # Search TV shows
+        return movies
+    
+    async def search_series(self, query: str, page: int = 1) -> List[Series]:
+        """Search TV shows"""
         series_data = await self._make_request("search/tv", {"query": query, "page": page})
         series_list = []
         
@@ -171,6 +431,14 @@ class TMDBService:
                 logger.error(f"Error transforming search series: {str(e)}")
                 continue
         
+        return series_list
+    
+    async def search_content(self, query: str, page: int = 1) -> tuple[List[Movie], List[Series]]:
+        """Search movies and TV shows concurrently"""
+        movies, series_list = await asyncio.gather(
+            self.search_movies(query, page),
+            self.search_series(query, page)
+        )
         return movies, series_list
     
     async def get_series_details(self, series_id: int) -> Optional[Series]:
@@ -197,317 +465,4 @@ class TMDBService:
             return self._transform_movie(data)
         except Exception as e:
             logger.error(f"Error transforming movie details: {str(e)}")
-            return None
-    
-    async def get_hindi_movies(self, page: int = 1) -> List[Movie]:
-        """Get Hindi movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "hi",
-            "sort_by": "popularity.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["hindi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming Hindi movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_old_hindi_movies(self, page: int = 1) -> List[Movie]:
-        """Get old Hindi movies (before 2000)"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "hi",
-            "primary_release_date.lte": "2000-12-31",
-            "sort_by": "popularity.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["old_hindi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming old Hindi movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_trending_hindi_movies(self, page: int = 1) -> List[Movie]:
-        """Get trending Hindi movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "hi",
-            "primary_release_date.gte": "2020-01-01",
-            "sort_by": "vote_average.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["trending_hindi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming trending Hindi movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_punjabi_movies(self, page: int = 1) -> List[Movie]:
-        """Get Punjabi movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "pa",
-            "sort_by": "popularity.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["punjabi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming Punjabi movie: {str(e)}")
-                continue
-        
-        # If no results from TMDB, add some mock Punjabi movies
-        if not movies:
-            movies = self._get_mock_punjabi_movies()
-                
-        return movies
-    
-    async def get_old_punjabi_movies(self, page: int = 1) -> List[Movie]:
-        """Get old Punjabi movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "pa",
-            "primary_release_date.lte": "2010-12-31",
-            "sort_by": "popularity.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["old_punjabi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming old Punjabi movie: {str(e)}")
-                continue
-        
-        # Fallback to mock data if no results
-        if not movies:
-            movies = self._get_mock_old_punjabi_movies()
-                
-        return movies
-    
-    async def get_trending_punjabi_movies(self, page: int = 1) -> List[Movie]:
-        """Get trending Punjabi movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_original_language": "pa",
-            "primary_release_date.gte": "2018-01-01",
-            "sort_by": "vote_average.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["trending_punjabi"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming trending Punjabi movie: {str(e)}")
-                continue
-        
-        # Fallback to mock data if no results
-        if not movies:
-            movies = self._get_mock_trending_punjabi_movies()
-                
-        return movies
-    
-    async def get_anime_movies(self, page: int = 1) -> List[Movie]:
-        """Get anime movies"""
-        data = await self._make_request("discover/movie", {
-            "page": page,
-            "with_genres": "16",  # Animation genre
-            "with_origin_country": "JP",
-            "sort_by": "popularity.desc"
-        })
-        movies = []
-        
-        for movie_data in data.get('results', []):
-            try:
-                movie = self._transform_movie(movie_data)
-                movie.categories = ["anime"]
-                movies.append(movie)
-            except Exception as e:
-                logger.error(f"Error transforming anime movie: {str(e)}")
-                continue
-                
-        return movies
-    
-    async def get_web_series(self, page: int = 1) -> List[Series]:
-        """Get popular web series"""
-        data = await self._make_request("discover/tv", {
-            "page": page,
-            "sort_by": "popularity.desc",
-            "vote_average.gte": 7.0
-        })
-        series_list = []
-        
-        for series_data in data.get('results', []):
-            try:
-                series = self._transform_series(series_data)
-                series.categories = ["web_series"]
-                series_list.append(series)
-            except Exception as e:
-                logger.error(f"Error transforming web series: {str(e)}")
-                continue
-                
-        return series_list
-    
-    def _get_mock_punjabi_movies(self) -> List[Movie]:
-        """Mock Punjabi movies data"""
-        mock_data = [
-            {
-                "title": "Chal Mera Putt",
-                "description": "A comedy-drama about Punjabi immigrants living in the UK and their struggles and friendships.",
-                "year": 2019,
-                "rating": 8.2,
-                "genre": ["Comedy", "Drama"],
-                "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&sat=1.2&hue=30",
-                "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&sat=1.2&hue=30",
-                "duration": "132 min"
-            },
-            {
-                "title": "Qismat",
-                "description": "A romantic drama about love, destiny, and the choices that shape our lives.",
-                "year": 2018,
-                "rating": 8.5,
-                "genre": ["Romance", "Drama"],
-                "thumbnail": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=300&h=400&fit=crop&sat=1.3&hue=350",
-                "backdrop_image": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=1280&h=720&fit=crop&sat=1.3&hue=350",
-                "duration": "141 min"
-            },
-            {
-                "title": "Shadaa",
-                "description": "A comedy about a man in his 30s who is still unmarried and the pressures he faces from family.",
-                "year": 2019,
-                "rating": 7.8,
-                "genre": ["Comedy", "Romance"],
-                "thumbnail": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=300&h=400&fit=crop&sat=1.1&hue=60",
-                "backdrop_image": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=1280&h=720&fit=crop&sat=1.1&hue=60",
-                "duration": "127 min"
-            }
-        ]
-        
-        movies = []
-        for data in mock_data:
-            movie = Movie(
-                title=data["title"],
-                description=data["description"],
-                genre=data["genre"],
-                rating=data["rating"],
-                year=data["year"],
-                thumbnail=data["thumbnail"],
-                backdrop_image=data["backdrop_image"],
-                categories=["punjabi"],
-                duration=data["duration"]
-            )
-            movies.append(movie)
-        
-        return movies
-    
-    def _get_mock_old_punjabi_movies(self) -> List[Movie]:
-        """Mock old Punjabi movies data"""
-        mock_data = [
-            {
-                "title": "Maula Jatt",
-                "description": "Classic Punjabi action film about a legendary warrior and his battles.",
-                "year": 1979,
-                "rating": 8.0,
-                "genre": ["Action", "Drama"],
-                "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&sat=0.8&contrast=1.2",
-                "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&sat=0.8&contrast=1.2",
-                "duration": "135 min"
-            },
-            {
-                "title": "Putt Jattan De",
-                "description": "A classic family drama showcasing Punjabi culture and traditions.",
-                "year": 1982,
-                "rating": 7.5,
-                "genre": ["Drama", "Family"],
-                "thumbnail": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=300&h=400&fit=crop&sat=0.7&sepia=0.3",
-                "backdrop_image": "https://images.unsplash.com/photo-1572188863110-46d457c9234d?w=1280&h=720&fit=crop&sat=0.7&sepia=0.3",
-                "duration": "142 min"
-            }
-        ]
-        
-        movies = []
-        for data in mock_data:
-            movie = Movie(
-                title=data["title"],
-                description=data["description"],
-                genre=data["genre"],
-                rating=data["rating"],
-                year=data["year"],
-                thumbnail=data["thumbnail"],
-                backdrop_image=data["backdrop_image"],
-                categories=["old_punjabi"],
-                duration=data["duration"]
-            )
-            movies.append(movie)
-        
-        return movies
-    
-    def _get_mock_trending_punjabi_movies(self) -> List[Movie]:
-        """Mock trending Punjabi movies data"""
-        mock_data = [
-            {
-                "title": "Honsla Rakh",
-                "description": "A modern comedy-drama starring Diljit Dosanjh about single parenthood and love.",
-                "year": 2021,
-                "rating": 8.1,
-                "genre": ["Comedy", "Romance"],
-                "thumbnail": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=300&h=400&fit=crop&brightness=1.1&hue=45",
-                "backdrop_image": "https://images.unsplash.com/photo-1616530940355-351fabd9524b?w=1280&h=720&fit=crop&brightness=1.1&hue=45",
-                "duration": "145 min"
-            },
-            {
-                "title": "Sufna",
-                "description": "A romantic drama about dreams, aspirations, and the journey of love.",
-                "year": 2020,
-                "rating": 8.3,
-                "genre": ["Romance", "Drama"],
-                "thumbnail": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=300&h=400&fit=crop&hue=320&sat=1.2",
-                "backdrop_image": "https://images.unsplash.com/photo-1626814026160-2237a95fc5a0?w=1280&h=720&fit=crop&hue=320&sat=1.2",
-                "duration": "130 min"
-            }
-        ]
-        
-        movies = []
-        for data in mock_data:
-            movie = Movie(
-                title=data["title"],
-                description=data["description"],
-                genre=data["genre"],
-                rating=data["rating"],
-                year=data["year"],
-                thumbnail=data["thumbnail"],
-                backdrop_image=data["backdrop_image"],
-                categories=["trending_punjabi"],
-                duration=data["duration"]
-            )
-            movies.append(movie)
-        
-        return movies
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -0,0 +1,197 @@
+import asyncio
+from typing import Any, Dict, Hashable, List, Optional
+import logging
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Movie, Series, Sports
+
+logger = logging.getLogger(__name__)
+
+# Queue marker telling the worker to drain and exit
+_STOP = object()
+
+
+class WriteBehindService:
+    """Persist catalog items off the request path.
+
+    Routes enqueue transformed items and return immediately. A background
+    worker deduplicates them (by tmdb_id for movies/series; items without one,
+    such as mock rows, are not persisted), batches them and
+    flushes to the database when a batch fills up or the flush interval
+    elapses. The queue is bounded; items offered while it is full are dropped
+    and counted rather than blocking the request.
+    """
+
+    def __init__(self, database, max_queue: Optional[int] = None, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None):
+        self.database = database
+        self.max_queue = max_queue or int(os.environ.get('WRITE_BEHIND_MAX_QUEUE', 10000))
+        self.batch_size = batch_size or int(os.environ.get('WRITE_BEHIND_BATCH_SIZE', 200))
+        self.flush_interval = flush_interval or float(os.environ.get('WRITE_BEHIND_FLUSH_INTERVAL', 1.0))
+        self.shutdown_timeout = float(os.environ.get('WRITE_BEHIND_SHUTDOWN_TIMEOUT', 10.0))
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+        self._pending: Dict[str, Dict[Hashable, Any]] = {"movies": {}, "series": {}, "sports": {}}
+        self._pending_count = 0
+        self._deadline: Optional[float] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.untracked = 0
+        self.deduplicated = 0
+        self.flushes = 0
+        self.flushed_items = 0
+        self.failed_flushes = 0
+
+    async def start(self):
+        """Start the background flush worker"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+            logger.info("Write-behind worker started")
+
+    async def stop(self):
+        """Drain queued items to the database and stop the worker"""
+        if self._worker is None or self._worker.done():
+            await self._drain()
+            return
+
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._worker, self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Write-behind drain timed out with {self._queue.qsize()} items queued")
+            self._worker.cancel()
+        self._worker = None
+        logger.info("Write-behind worker stopped")
+
+    # Producers
+    def enqueue_movies(self, movies: List[Movie]) -> int:
+        return self._enqueue("movies", self._tracked(movies))
+
+    def enqueue_series(self, series_list: List[Series]) -> int:
+        return self._enqueue("series", self._tracked(series_list))
+
+    def enqueue_sports_events(self, events: List[Sports]) -> int:
+        return self._enqueue("sports", events)
+
+    def _tracked(self, items: List[Any]) -> List[Any]:
+        """Drop catalog items without a tmdb_id (mock rows).
+
+        They cannot be upserted by tmdb_id, so each copy would be inserted as
+        a new document with a fresh id.
+        """
+        tracked = [item for item in items if item.tmdb_id]
+        self.untracked += len(items) - len(tracked)
+        return tracked
+
+    def _enqueue(self, kind: str, items: List[Any]) -> int:
+        """Queue items without blocking; returns how many were accepted"""
+        accepted = 0
+        for item in items:
+            try:
+                self._queue.put_nowait((kind, item))
+                accepted += 1
+            except asyncio.QueueFull:
+                self.dropped += len(items) - accepted
+                logger.warning(f"Write-behind queue full, dropped {len(items) - accepted} {kind}")
+                break
+
+        self.enqueued += accepted
+        return accepted
+
+    # Worker
+    @staticmethod
+    def _item_key(kind: str, item: Any) -> Hashable:
+        if kind == "sports":
+            return (item.title, item.start_time)
+        return item.tmdb_id if item.tmdb_id else item.id
+
+    def _add_pending(self, kind: str, item: Any):
+        pending = self._pending[kind]
+        key = self._item_key(kind, item)
+        if key in pending:
+            self.deduplicated += 1
+            if kind != "sports":
+                # Keep every row the title was seen in; the latest copy wins otherwise
+                categories = list(dict.fromkeys(pending[key].categories + item.categories))
+                item = item.model_copy(update={"categories": categories})
+        else:
+            self._pending_count += 1
+        pending[key] = item
+
+        if self._deadline is None:
+            self._deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            timeout = None if self._deadline is None else max(0.0, self._deadline - loop.time())
+            try:
+                entry = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                entry = None
+
+            if entry is _STOP:
+                await self._drain()
+                return
+
+            if entry is not None:
+                self._add_pending(*entry)
+                # Pick up whatever else is already queued without yielding
+                while self._pending_count < self.batch_size and not self._queue.empty():
+                    entry = self._queue.get_nowait()
+                    if entry is _STOP:
+                        await self._drain()
+                        return
+                    self._add_pending(*entry)
+
+            if self._pending_count >= self.batch_size or (
+                    self._deadline is not None and loop.time() >= self._deadline):
+                await self._flush()
+
+    async def _drain(self):
+        """Move everything still queued into the pending batch and flush it"""
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not _STOP:
+                self._add_pending(*entry)
+        await self._flush()
+
+    async def _flush(self):
+        pending = self._pending
+        self._pending = {"movies": {}, "series": {}, "sports": {}}
+        self._pending_count = 0
+        self._deadline = None
+
+        writers = {
+            "movies": self.database.save_movies,
+            "series": self.database.save_series,
+            "sports": self.database.save_sports_events
+        }
+        for kind, items in pending.items():
+            if not items:
+                continue
+            try:
+                await writers[kind](list(items.values()))
+                self.flushes += 1
+                self.flushed_items += len(items)
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.error(f"Write-behind flush of {len(items)} {kind} failed: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue": self.max_queue,
+            "pending": self._pending_count,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "untracked": self.untracked,
+            "deduplicated": self.deduplicated,
+            "flushes": self.flushes,
+            "flushed_items": self.flushed_items,
+            "failed_flushes": self.failed_flushes
+        }
@@ -19,6 +19,9 @@ const Home = () => {
     punjabiMovies,
     oldPunjabiMovies,
     trendingPunjabiMovies,
+    tamilMovies,
+    teluguMovies,
+    koreanMovies,
     animeMovies,
     trendingSeries, 
     webSeries,
@@ -136,6 +139,30 @@ const Home = () => {
             />
           )}
 
+          {tamilMovies.length > 0 && (
+            <ContentCarousel 
+              title="🌴 Tamil Movies" 
+              items={tamilMovies} 
+              type="movie"
+            />
+          )}
+
+          {teluguMovies.length > 0 && (
+            <ContentCarousel 
+              title="🎬 Telugu Movies" 
+              items={teluguMovies} 
+              type="movie"
+            />
+          )}
+
+          {koreanMovies.length > 0 && (
+            <ContentCarousel 
+              title="🇰🇷 Korean Movies" 
+              items={koreanMovies} 
+              type="movie"
+            />
+          )}
+
           {animeMovies.length > 0 && (
             <ContentCarousel 
               title="🎌 Anime Movies" 
@@ -170,7 +197,7 @@ const Home = () => {
           
           {/* Show message if no content available */}
           {!trendingMovies.length && !popularMovies.length && !sportsContent.length && !trendingSeries.length && 
-           !hindiMovies.length && !punjabiMovies.length && !animeMovies.length && !webSeries.length && (
+           !hindiMovies.length && !punjabiMovies.length && !tamilMovies.length && !teluguMovies.length && !koreanMovies.length && !animeMovies.length && !webSeries.length && (
             <div className="text-center py-20">
               <p className="text-gray-400 text-lg">No content available at the moment.</p>
               <p className="text-gray-500 mt-2">Please check back later.</p>
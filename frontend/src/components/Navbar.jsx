@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState } from 'react';
 import { Search, Menu, X, User, Bell } from 'lucide-react';
 import { Button } from './ui/button';
 import { Input } from './ui/input';
@@ -7,34 +7,43 @@ import { useSearch } from '../hooks/useSearch';
 const Navbar = () => {
   const [isMenuOpen, setIsMenuOpen] = useState(false);
   const [searchQuery, setSearchQuery] = useState('');
+  const [submittedQuery, setSubmittedQuery] = useState('');
   const [showSearchResults, setShowSearchResults] = useState(false);
-  const { searchResults, isSearching, search, clearSearch } = useSearch();
+  const { searchResults, isSearching, search, suggestions, suggest, clearSearch } = useSearch();
 
   const navItems = ['Home', 'Movies', 'TV Shows', 'Sports', 'My List'];
 
-  // Debounced search
-  useEffect(() => {
-    const timer = setTimeout(() => {
-      if (searchQuery.trim()) {
-        search(searchQuery);
-        setShowSearchResults(true);
-      } else {
-        clearSearch();
-        setShowSearchResults(false);
-      }
-    }, 300);
-
-    return () => clearTimeout(timer);
-  }, [searchQuery, search, clearSearch]);
+  // Full results are shown for the submitted query; while typing, type-ahead suggestions
+  const showingResults = submittedQuery !== '' && submittedQuery === searchQuery;
 
   const handleSearchInputChange = (e) => {
-    setSearchQuery(e.target.value);
+    const query = e.target.value;
+    setSearchQuery(query);
+    if (query.trim()) {
+      // Debounced in useSearch and served from the local index, not TMDB
+      suggest(query);
+      setShowSearchResults(true);
+    } else {
+      clearSearch();
+      setSubmittedQuery('');
+      setShowSearchResults(false);
+    }
+  };
+
+  const handleSearchSubmit = (e) => {
+    e.preventDefault();
+    if (!searchQuery.trim()) return;
+    setSubmittedQuery(searchQuery);
+    search(searchQuery);
+    setShowSearchResults(true);
   };
 
   const handleSearchItemClick = (item) => {
     console.log(`Selected: ${item.title}`);
     setShowSearchResults(false);
     setSearchQuery('');
+    setSubmittedQuery('');
+    clearSearch();
     // Here you would navigate to the item details page
   };
 
@@ -64,7 +73,7 @@ const Navbar = () => {
 
           {/* Search and User Actions */}
           <div className="hidden md:flex items-center space-x-4">
-            <div className="relative">
+            <form className="relative" onSubmit={handleSearchSubmit}>
               <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4" />
               <Input
                 type="text"
@@ -74,8 +83,34 @@ const Navbar = () => {
                 className="pl-10 w-64 bg-gray-900/50 border-gray-700 text-white placeholder-gray-400 focus:border-red-500"
               />
               
+              {/* Type-ahead Suggestions Dropdown */}
+              {showSearchResults && !showingResults && suggestions.length > 0 && (
+                <div className="absolute top-full left-0 right-0 mt-1 bg-gray-900 border border-gray-700 rounded-md shadow-xl max-h-96 overflow-y-auto z-50">
+                  {suggestions.map((suggestion) => (
+                    <button
+                      type="button"
+                      key={suggestion.id}
+                      onClick={() => handleSearchItemClick(suggestion)}
+                      className="w-full px-4 py-2 text-left hover:bg-gray-800 flex items-center space-x-3"
+                    >
+                      <img
+                        src={suggestion.thumbnail}
+                        alt={suggestion.title}
+                        className="w-10 h-14 object-cover rounded"
+                      />
+                      <div>
+                        <p className="text-white text-sm">{suggestion.title}</p>
+                        <p className="text-gray-400 text-xs">
+                          {suggestion.year} · {suggestion.content_type === 'series' ? 'TV Series' : 'Movie'}
+                        </p>
+                      </div>
+                    </button>
+                  ))}
+                </div>
+              )}
+              
               {/* Search Results Dropdown */}
-              {showSearchResults && (searchResults.movies.length > 0 || searchResults.series.length > 0 || isSearching) && (
+              {showSearchResults && showingResults && (searchResults.movies.length > 0 || searchResults.series.length > 0 || isSearching) && (
                 <div className="absolute top-full left-0 right-0 mt-1 bg-gray-900 border border-gray-700 rounded-md shadow-xl max-h-96 overflow-y-auto z-50">
                   {isSearching ? (
                     <div className="p-4 text-center text-gray-400">Searching...</div>
@@ -86,6 +121,7 @@ const Navbar = () => {
                           <div className="px-4 py-2 text-sm font-semibold text-gray-300 bg-gray-800">Movies</div>
                           {searchResults.movies.slice(0, 3).map((movie) => (
                             <button
+                              type="button"
                               key={movie.id}
                               onClick={() => handleSearchItemClick(movie)}
                               className="w-full px-4 py-2 text-left hover:bg-gray-800 flex items-center space-x-3"
@@ -109,6 +145,7 @@ const Navbar = () => {
                           <div className="px-4 py-2 text-sm font-semibold text-gray-300 bg-gray-800">TV Series</div>
                           {searchResults.series.slice(0, 3).map((series) => (
                             <button
+                              type="button"
                               key={series.id}
                               onClick={() => handleSearchItemClick(series)}
                               className="w-full px-4 py-2 text-left hover:bg-gray-800 flex items-center space-x-3"
@@ -134,7 +171,7 @@ const Navbar = () => {
                   )}
                 </div>
               )}
-            </div>
+            </form>
             <Button variant="ghost" size="sm" className="text-gray-300 hover:text-white">
               <Bell className="w-5 h-5" />
             </Button>
@@ -171,7 +208,7 @@ const Navbar = () => {
                 </a>
               ))}
               <div className="mt-4 pt-4 border-t border-gray-700">
-                <div className="relative mb-3">
+                <form className="relative mb-3" onSubmit={handleSearchSubmit}>
                   <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4" />
                   <Input
                     type="text"
@@ -180,7 +217,7 @@ const Navbar = () => {
                     onChange={handleSearchInputChange}
                     className="pl-10 w-full bg-gray-800 border-gray-600 text-white placeholder-gray-400"
                   />
-                </div>
+                </form>
                 <div className="flex space-x-2">
                   <Button variant="ghost" size="sm" className="text-gray-300 hover:text-white flex-1">
                     <Bell className="w-4 h-4 mr-2" />
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { moviesAPI, seriesAPI, sportsAPI } from '../services/api';
+import { homeAPI } from '../services/api';
 
 export const useMovies = () => {
   const [trendingMovies, setTrendingMovies] = useState([]);
@@ -10,6 +10,9 @@ export const useMovies = () => {
   const [punjabiMovies, setPunjabiMovies] = useState([]);
   const [oldPunjabiMovies, setOldPunjabiMovies] = useState([]);
   const [trendingPunjabiMovies, setTrendingPunjabiMovies] = useState([]);
+  const [tamilMovies, setTamilMovies] = useState([]);
+  const [teluguMovies, setTeluguMovies] = useState([]);
+  const [koreanMovies, setKoreanMovies] = useState([]);
   const [animeMovies, setAnimeMovies] = useState([]);
   const [trendingSeries, setTrendingSeries] = useState([]);
   const [webSeries, setWebSeries] = useState([]);
@@ -22,68 +25,26 @@ export const useMovies = () => {
       setLoading(true);
       setError(null);
 
-      // Fetch all content in parallel
-      const requests = await Promise.allSettled([
-        moviesAPI.getTrending(),
-        moviesAPI.getPopular(),
-        moviesAPI.getHindi(),
-        moviesAPI.getOldHindi(),
-        moviesAPI.getTrendingHindi(),
-        moviesAPI.getPunjabi(),
-        moviesAPI.getOldPunjabi(),
-        moviesAPI.getTrendingPunjabi(),
-        moviesAPI.getAnime(),
-        seriesAPI.getTrending(),
-        seriesAPI.getWeb(),
-        sportsAPI.getAll()
-      ]);
-
-      // Handle results
-      const results = requests.map(result => 
-        result.status === 'fulfilled' ? result.value.data || [] : []
-      );
-
-      const [
-        trendingRes,
-        popularRes,
-        hindiRes,
-        oldHindiRes,
-        trendingHindiRes,
-        punjabiRes,
-        oldPunjabiRes,
-        trendingPunjabiRes,
-        animeRes,
-        trendingSeriesRes,
-        webSeriesRes,
-        sportsRes
-      ] = results;
+      // Fetch every row in a single request; the server builds them in parallel
+      const response = await homeAPI.getFeed();
+      const { movies = {}, series = {}, sports = [] } = response.data || {};
 
       // Set all the state
-      setTrendingMovies(trendingRes);
-      setPopularMovies(popularRes);
-      setHindiMovies(hindiRes);
-      setOldHindiMovies(oldHindiRes);
-      setTrendingHindiMovies(trendingHindiRes);
-      setPunjabiMovies(punjabiRes);
-      setOldPunjabiMovies(oldPunjabiRes);
-      setTrendingPunjabiMovies(trendingPunjabiRes);
-      setAnimeMovies(animeRes);
-      setTrendingSeries(trendingSeriesRes);
-      setWebSeries(webSeriesRes);
-      setSportsContent(sportsRes);
-
-      // Log any failed requests
-      requests.forEach((result, index) => {
-        if (result.status === 'rejected') {
-          const categories = [
-            'trending movies', 'popular movies', 'hindi movies', 'old hindi movies',
-            'trending hindi movies', 'punjabi movies', 'old punjabi movies',
-            'trending punjabi movies', 'anime movies', 'trending series',
-            'web series', 'sports content'
-          ];
-          console.error(`Failed to fetch ${categories[index]}:`, result.reason);
-        }
-      });
+      setTrendingMovies(movies.trending || []);
+      setPopularMovies(movies.popular || []);
+      setHindiMovies(movies.hindi || []);
+      setOldHindiMovies(movies.old_hindi || []);
+      setTrendingHindiMovies(movies.trending_hindi || []);
+      setPunjabiMovies(movies.punjabi || []);
+      setOldPunjabiMovies(movies.old_punjabi || []);
+      setTrendingPunjabiMovies(movies.trending_punjabi || []);
+      setTamilMovies(movies.tamil || []);
+      setTeluguMovies(movies.telugu || []);
+      setKoreanMovies(movies.korean || []);
+      setAnimeMovies(movies.anime || []);
+      setTrendingSeries(series.trending || []);
+      setWebSeries(series.web || []);
+      setSportsContent(sports);
 
     } catch (err) {
       console.error('Error fetching content:', err);
@@ -110,6 +71,9 @@ export const useMovies = () => {
     punjabiMovies,
     oldPunjabiMovies,
     trendingPunjabiMovies,
+    tamilMovies,
+    teluguMovies,
+    koreanMovies,
     animeMovies,
     trendingSeries,
     webSeries,
@@ -1,10 +1,18 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef, useEffect } from 'react';
 import { searchAPI } from '../services/api';
 
+// Delay before a type-ahead request is sent, so fast typing sends one request
+const SUGGEST_DEBOUNCE_MS = 200;
+
 export const useSearch = () => {
   const [searchResults, setSearchResults] = useState({ movies: [], series: [], total: 0 });
   const [isSearching, setIsSearching] = useState(false);
   const [searchError, setSearchError] = useState(null);
+  const [suggestions, setSuggestions] = useState([]);
+  const suggestTimer = useRef(null);
+  const latestSuggestQuery = useRef('');
+
+  useEffect(() => () => clearTimeout(suggestTimer.current), []);
 
   const search = useCallback(async (query, page = 1) => {
     if (!query.trim()) {
@@ -27,8 +35,32 @@ export const useSearch = () => {
     }
   }, []);
 
+  const suggest = useCallback((query) => {
+    clearTimeout(suggestTimer.current);
+    latestSuggestQuery.current = query;
+
+    if (!query.trim()) {
+      setSuggestions([]);
+      return;
+    }
+
+    suggestTimer.current = setTimeout(async () => {
+      try {
+        const response = await searchAPI.suggest(query);
+        // Ignore responses that arrive after the user kept typing
+        if (latestSuggestQuery.current === query) {
+          setSuggestions(response.data.suggestions || []);
+        }
+      } catch (error) {
+        console.error('Suggest error:', error);
+      }
+    }, SUGGEST_DEBOUNCE_MS);
+  }, []);
+
   const clearSearch = useCallback(() => {
+    clearTimeout(suggestTimer.current);
     setSearchResults({ movies: [], series: [], total: 0 });
+    setSuggestions([]);
     setSearchError(null);
   }, []);
 
@@ -37,6 +69,8 @@ export const useSearch = () => {
     isSearching,
     searchError,
     search,
+    suggestions,
+    suggest,
     clearSearch
   };
 };
\ No newline at end of file
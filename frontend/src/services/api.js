@@ -40,6 +40,11 @@ export const authAPI = {
   getProfile: () => api.get('/user/profile'),
 };
 
+// Home feed API (all carousel rows in one request)
+export const homeAPI = {
+  getFeed: (view = 'card') => api.get('/home', { params: { view } }),
+};
+
 // Movies APIs
 export const moviesAPI = {
   getTrending: (page = 1) => api.get(`/movies/trending?page=${page}`),
@@ -52,6 +57,7 @@ export const moviesAPI = {
   getTrendingPunjabi: (page = 1) => api.get(`/movies/punjabi/trending?page=${page}`),
   getAnime: (page = 1) => api.get(`/movies/anime?page=${page}`),
   getDetails: (movieId) => api.get(`/movies/${movieId}`),
+  getBatch: (movieIds) => api.get('/movies/batch', { params: { ids: movieIds.join(',') } }),
 };
 
 // Series APIs
@@ -59,6 +65,7 @@ export const seriesAPI = {
   getTrending: (page = 1) => api.get(`/series/trending?page=${page}`),
   getWeb: (page = 1) => api.get(`/series/web?page=${page}`),
   getDetails: (seriesId) => api.get(`/series/${seriesId}`),
+  getBatch: (seriesIds) => api.get('/series/batch', { params: { ids: seriesIds.join(',') } }),
 };
 
 // Sports APIs
@@ -72,13 +79,16 @@ export const sportsAPI = {
 // Search API
 export const searchAPI = {
   searchContent: (query, page = 1) => api.get(`/search?q=${encodeURIComponent(query)}&page=${page}`),
+  suggest: (query, limit = 10) => api.get(`/search/suggest?q=${encodeURIComponent(query)}&limit=${limit}`),
 };
 
 // Watchlist APIs
 export const watchlistAPI = {
   add: (contentData) => api.post('/user/watchlist', contentData),
-  get: () => api.get('/user/watchlist'),
+  get: (cursor = null, limit = 20) => api.get('/user/watchlist', { params: { limit, ...(cursor && { cursor }) } }),
   remove: (contentId) => api.delete(`/user/watchlist/${contentId}`),
+  addBatch: (items) => api.post('/user/watchlist/batch', { items }),
+  removeBatch: (contentIds) => api.post('/user/watchlist/batch/remove', { content_ids: contentIds }),
 };
 
 export default api;
\ No newline at end of file